@@ -48,6 +48,9 @@ setup(
             "pytest>=7.0",
             "pytest-cov>=3.0",
         ],
+        "fast": [
+            "numba>=0.56",
+        ],
         "tutorials": [
             "jupyter>=1.0",
             "matplotlib>=3.5.0",
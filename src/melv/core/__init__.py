@@ -8,23 +8,37 @@ This package contains the core MELV calculations:
 
 from .interaction import (
     calculate_i_factor,
+    calculate_i_factor_batch,
     analyze_interaction,
     compare_multiple_interactions,
-    InteractionResult
+    InteractionResult,
+    InteractionResultArray
 )
 
 from .compatibility import (
     calculate_beta,
+    calculate_beta_batch,
+    calculate_beta_and_combined,
     combined_analysis,
-    CompatibilityResult
+    CompatibilityResult,
+    CombinedResult,
+    PRED_TABLE,
+    CONF_TABLE
 )
 
 __all__ = [
     'calculate_i_factor',
+    'calculate_i_factor_batch',
     'analyze_interaction',
     'compare_multiple_interactions',
     'InteractionResult',
+    'InteractionResultArray',
     'calculate_beta',
+    'calculate_beta_batch',
+    'calculate_beta_and_combined',
     'combined_analysis',
     'CompatibilityResult',
+    'CombinedResult',
+    'PRED_TABLE',
+    'CONF_TABLE',
 ]
@@ -0,0 +1,27 @@
+"""
+MELV-Core: Optional Numba acceleration
+
+Numba is an optional dependency (``pip install melv-core[fast]``). When it is
+installed, `njit` and `prange` are Numba's own; otherwise they fall back to
+no-op equivalents and the kernels run as ordinary Python.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit supporting both @njit and @njit(...)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
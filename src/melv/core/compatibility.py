@@ -18,16 +18,130 @@ License: MIT
 Version: 0.1.0
 """
 
+import sys
 import numpy as np
-from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, Tuple, Union
 
+from ._jit import NUMBA_AVAILABLE, njit, prange
 
-@dataclass
-class CompatibilityResult:
+ArrayLike = Union[float, np.ndarray]
+
+# Result dataclasses use __slots__ where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Prediction and confidence labels, indexed by the codes from _predict_codes
+PRED_TABLE = (
+    "Stable cooperation",
+    "Cooperation likely",
+    "Cooperation with fluctuations",
+    "Cooperation possible",
+    "Unstable regime (near critical point)",
+    "Mild competition",
+    "Strong competition",
+    "Cooperation possible but inefficient",
+)
+CONF_TABLE = ("High", "Moderate", "Low to Moderate", "Low")
+
+# The (prediction, confidence) outcomes of _make_prediction, keyed by their
+# _predict_codes codes and prebuilt so the scalar path returns an existing tuple
+_PREDICTION_PAIRS = {
+    (p, c): (PRED_TABLE[p], CONF_TABLE[c])
+    for p, c in (
+        (0, 0), (0, 1), (1, 1), (2, 1), (3, 2), (4, 3), (5, 1), (6, 0), (7, 3)
+    )
+}
+
+# Default weights: equal importance. Built once so the common call needs
+# no weight validation.
+_DEFAULT_WEIGHTS = (0.33, 0.33, 0.34)
+_DEFAULT_WEIGHTS_ARRAY = np.array(_DEFAULT_WEIGHTS)
+
+# Regime from i-factor: below 1.0, within 0.05 above it, or beyond
+_REGIME_BOUNDS = (1.0, 1.05)
+_REGIME_LABELS = ("Cooperative", "Critical", "Competitive")
+
+# Interpretation categories. A value's band is the number of bounds it lies
+# strictly above, which indexes the matching label tuple.
+_BETA_BOUNDS = (0.4, 0.6, 0.8)
+_DIMENSION_BOUNDS = (0.6, 0.8)
+_COOP_BOUNDS = (0.5, 0.7)
+_COMBINED_BETA_BOUNDS = (0.5, 0.7)
+
+_BETA_LABELS = (
+    "LIMITED compatibility: ",
+    "MODERATE compatibility: ",
+    "GOOD compatibility: ",
+    "EXCELLENT compatibility: ",
+)
+_PHYS_LABELS = (
+    "Physical constraints present\n",
+    "Good physical match\n",
+    "Strong physical compatibility\n",
+)
+_SERVICE_LABELS = (
+    "Service-need mismatch detected\n",
+    "Services align reasonably well\n",
+    "Excellent service-need matching\n",
+)
+_TEMPORAL_LABELS = (
+    "Temporal coordination challenges\n",
+    "Adequate timing coordination\n",
+    "Strong temporal synchronization\n",
+)
+_PERP_LABELS = (
+    "Sustainability concerns\n",
+    "Reasonably sustainable\n",
+    "Highly sustainable relationship\n",
+)
+_COOP_LABELS = (
+    "Limited cooperation potential",
+    "Moderate cooperation potential",
+    "Strong potential for lasting cooperation",
+)
+_COMBINED_BETA_LABELS = (
+    "  ✗ Limited compatibility\n",
+    "  ~ Moderate compatibility\n",
+    "  ✓ High compatibility for cooperation\n",
+)
+_COMBINED_I_LABELS = (
+    "  ✗ Interaction costs exceed benefits\n"
+    "  ✗ Competition is energetically favorable\n",
+    "  ✓ Interaction costs below critical threshold\n"
+    "  ✓ Cooperation is energetically favorable\n",
+)
+_EXPLANATIONS = (
+    "Both conditions favor cooperation: low interaction costs (i < 1) "
+    "and good compatibility (β > 0.6). Expect cooperative dynamics.\n",
+    "Low interaction costs favor cooperation, but poor compatibility "
+    "limits effectiveness. Cooperation may emerge but be inefficient.\n",
+    "High interaction costs (i > 1) create competitive pressure. "
+    "Even with good compatibility, cooperation is unlikely to emerge.\n",
+    "System near critical threshold. Outcomes highly sensitive to "
+    "small parameter changes. Monitor closely for regime shifts.\n",
+)
+
+
+class _Interpreted:
+    """
+    Base of the result dataclasses. The lazily built interpretation lives
+    in this slot rather than in a dataclass field, so fields(), asdict()
+    and replace() see only the results. It is not restored by unpickling,
+    which sets fields only; it is then rebuilt on access.
+    """
+    __slots__ = ('_interpretation',)
+
+
+@dataclass(frozen=True, init=False, **_SLOTS)
+class CompatibilityResult(_Interpreted):
     """
     Results from β-factor calculation.
     
+    Fields hold floats, or arrays for batch calculations. Supports
+    dict-style access (result['beta']) as well as attributes; to_dict()
+    gives a plain dictionary.
+    
     Attributes:
         beta: Overall compatibility coefficient (0-1)
         physical: Physical compatibility (0-1)
@@ -35,7 +149,7 @@ class CompatibilityResult:
         temporal: Temporal coordination (0-1)
         perpetuity: Sustainability factor φ (0-1)
         cooperation_potential: φ × β
-        interpretation: Human-readable explanation
+        interpretation: Human-readable explanation, built on first access
     """
     beta: float
     physical: float
@@ -43,22 +157,174 @@ class CompatibilityResult:
     temporal: float
     perpetuity: Optional[float] = None
     cooperation_potential: Optional[float] = None
-    interpretation: str = ""
+    
+    def __init__(
+        self,
+        beta: float,
+        physical: float,
+        service: float,
+        temporal: float,
+        perpetuity: Optional[float] = None,
+        cooperation_potential: Optional[float] = None,
+        interpretation: Optional[str] = None
+    ):
+        # Written out so that interpretation stays an optional argument, as
+        # in earlier versions; when omitted it is built on first access
+        set_field = object.__setattr__
+        set_field(self, 'beta', beta)
+        set_field(self, 'physical', physical)
+        set_field(self, 'service', service)
+        set_field(self, 'temporal', temporal)
+        set_field(self, 'perpetuity', perpetuity)
+        set_field(self, 'cooperation_potential', cooperation_potential)
+        set_field(self, '_interpretation', interpretation)
+    
+    @property
+    def interpretation(self) -> Union[str, np.ndarray]:
+        """Human-readable explanation (an array of them for array results)."""
+        text = getattr(self, '_interpretation', None)
+        if text is None:
+            text = _interpret(
+                _generate_beta_interpretation,
+                isinstance(self.beta, np.ndarray),
+                self.beta, self.physical, self.service, self.temporal,
+                self.perpetuity, self.cooperation_potential
+            )
+            object.__setattr__(self, '_interpretation', text)
+        return text
+    
+    def __getitem__(self, key: str):
+        return _result_item(self, key)
+    
+    def __contains__(self, key) -> bool:
+        return _result_has(self, key)
+    
+    def to_dict(self, include_interpretation: bool = True) -> Dict:
+        """Plain dict of the results, as returned by earlier versions."""
+        return _result_dict(self, include_interpretation)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class CombinedResult(_Interpreted):
+    """
+    Results from combined i-factor and β-factor analysis.
+    
+    Fields hold floats/strings, or arrays when combined_analysis was given
+    arrays. Supports dict-style access (result['prediction']) as well as
+    attributes; to_dict() gives a plain dictionary.
+    
+    Attributes:
+        i_factor: Interaction efficiency factor
+        beta: Compatibility coefficient
+        regime: Regime implied by the i-factor
+        prediction: Overall regime prediction
+        confidence: Confidence level in prediction
+        perpetuity: Sustainability factor φ, if provided
+        cooperation_potential: φ × β, if perpetuity provided
+        overlap: Resource overlap, if provided (used in interpretation)
+        differentiation: Service differentiation, if provided
+        interpretation: Detailed analysis, built on first access
+    """
+    i_factor: float
+    beta: float
+    regime: str
+    prediction: str
+    confidence: str
+    perpetuity: Optional[float] = None
+    cooperation_potential: Optional[float] = None
+    overlap: Optional[float] = None
+    differentiation: Optional[float] = None
+    
+    @property
+    def interpretation(self) -> Union[str, np.ndarray]:
+        """Detailed analysis (an array of them for array results)."""
+        text = getattr(self, '_interpretation', None)
+        if text is None:
+            text = _interpret(
+                _generate_combined_interpretation,
+                isinstance(self.i_factor, np.ndarray),
+                self.i_factor, self.beta, self.perpetuity,
+                self.cooperation_potential, self.regime, self.prediction,
+                self.confidence, self.overlap, self.differentiation
+            )
+            object.__setattr__(self, '_interpretation', text)
+        return text
+    
+    def __getitem__(self, key: str):
+        return _result_item(self, key)
+    
+    def __contains__(self, key) -> bool:
+        return _result_has(self, key)
+    
+    def to_dict(self, include_interpretation: bool = True) -> Dict:
+        """Plain dict of the results, as returned by earlier versions."""
+        return _result_dict(self, include_interpretation)
+
+
+def _result_item(result, key: str):
+    """Dict-style field lookup shared by the result dataclasses."""
+    if key == 'interpretation':
+        return result.interpretation
+    if _result_has(result, key):
+        return getattr(result, key)
+    raise KeyError(key)
+
+
+def _result_has(result, key) -> bool:
+    """Whether key names a public field of a result, or its interpretation."""
+    return key == 'interpretation' or (
+        isinstance(key, str) and not key.startswith('_')
+        and key in result.__dataclass_fields__
+    )
+
+
+def _result_dict(result, include_interpretation: bool) -> Dict:
+    """Public fields of a result dataclass (plus interpretation) as a dict."""
+    data = {
+        f.name: getattr(result, f.name)
+        for f in fields(result) if not f.name.startswith('_')
+    }
+    if include_interpretation:
+        data['interpretation'] = result.interpretation
+    return data
+
+
+def _interpret(generate, elementwise: bool, *values):
+    """
+    Call an interpretation generator on a result's values.
+    
+    Scalar results give one string. Array results (elementwise, i.e. their
+    leading value is an ndarray) give an object array of strings, one per
+    case.
+    """
+    if not elementwise:
+        return generate(*values)
+    
+    shape = np.broadcast_shapes(*(np.shape(v) for v in values if v is not None))
+    arrays = [None if v is None else np.broadcast_to(v, shape) for v in values]
+    out = np.empty(shape, dtype=object)
+    for idx in np.ndindex(shape):
+        out[idx] = generate(*(None if a is None else a[idx].item() for a in arrays))
+    return out
 
 
 def calculate_beta(
-    physical: float,
-    service: float,
-    temporal: float,
-    perpetuity: Optional[float] = None,
+    physical: ArrayLike,
+    service: ArrayLike,
+    temporal: ArrayLike,
+    perpetuity: Optional[ArrayLike] = None,
     weights: Optional[Tuple[float, float, float]] = None
-) -> Dict:
+) -> CompatibilityResult:
     """
     Calculate the β-factor (compatibility coefficient).
     
     β quantifies how well entities can cooperate when i < 1.0.
     It combines multiple compatibility dimensions.
     
+    The dimensions may also be given as arrays (e.g. a parameter sweep or
+    Monte-Carlo sample); β is then evaluated for every case in one weighted
+    sum and the result holds arrays instead of floats.
+    
     Parameters:
         physical: Physical compatibility (0-1)
             Can entities physically interact? Spatial proximity, size matching, etc.
@@ -72,14 +338,14 @@ def calculate_beta(
             Default: (0.33, 0.33, 0.34) for equal weighting
     
     Returns:
-        Dictionary containing:
+        CompatibilityResult (supports result['key'] access) containing:
             - beta: Overall compatibility (weighted average)
             - physical: Physical compatibility
             - service: Service quality
             - temporal: Temporal coordination
             - perpetuity: φ factor if provided
             - cooperation_potential: φ × β if perpetuity provided
-            - interpretation: Human-readable explanation
+            - interpretation: Human-readable explanation, generated lazily
     
     Examples:
         >>> result = calculate_beta(
@@ -92,8 +358,24 @@ def calculate_beta(
         β = 0.83
         >>> print(f"Cooperation potential = {result['cooperation_potential']:.2f}")
         Cooperation potential = 0.73
+        
+        >>> # Batch of cases
+        >>> result = calculate_beta(
+        ...     physical=np.array([0.85, 0.40]),
+        ...     service=np.array([0.90, 0.50]),
+        ...     temporal=np.array([0.75, 0.60])
+        ... )
+        >>> print(np.round(result['beta'], 2))
+        [0.83 0.5 ]
     """
     
+    if not (np.isscalar(physical) and np.isscalar(service)
+            and np.isscalar(temporal)
+            and (perpetuity is None or np.isscalar(perpetuity))):
+        return _calculate_beta_array(
+            physical, service, temporal, perpetuity, weights
+        )
+    
     # Validate inputs
     for name, value in [('physical', physical), ('service', service), ('temporal', temporal)]:
         if not (0 <= value <= 1):
@@ -102,15 +384,7 @@ def calculate_beta(
     if perpetuity is not None and not (0 <= perpetuity <= 1):
         raise ValueError(f"perpetuity must be in [0, 1], got {perpetuity}")
     
-    # Default weights: equal importance
-    if weights is None:
-        weights = (0.33, 0.33, 0.34)
-    
-    # Validate weights
-    if len(weights) != 3:
-        raise ValueError(f"weights must have 3 values, got {len(weights)}")
-    if not np.isclose(sum(weights), 1.0, atol=0.01):
-        raise ValueError(f"weights must sum to 1.0, got {sum(weights)}")
+    weights = _validate_weights(weights)
     
     # Calculate β as weighted average
     beta = float(
@@ -124,20 +398,188 @@ def calculate_beta(
     if perpetuity is not None:
         cooperation_potential = perpetuity * beta
     
-    # Generate interpretation
-    interpretation = _generate_beta_interpretation(
-        beta, physical, service, temporal, perpetuity, cooperation_potential
+    # Interpretation is generated on first access
+    return CompatibilityResult(
+        beta=beta,
+        physical=physical,
+        service=service,
+        temporal=temporal,
+        perpetuity=perpetuity,
+        cooperation_potential=cooperation_potential
     )
+
+
+def _validate_weights(
+    weights: Optional[Tuple[float, float, float]]
+) -> Tuple[float, float, float]:
+    """Return the weights to use, checking user-supplied ones."""
+    if weights is None or weights is _DEFAULT_WEIGHTS:
+        return _DEFAULT_WEIGHTS
     
-    return {
-        'beta': beta,
-        'physical': physical,
-        'service': service,
-        'temporal': temporal,
-        'perpetuity': perpetuity,
-        'cooperation_potential': cooperation_potential,
-        'interpretation': interpretation
-    }
+    if len(weights) != 3:
+        raise ValueError(f"weights must have 3 values, got {len(weights)}")
+    total = weights[0] + weights[1] + weights[2]
+    # Same tolerance as np.isclose(total, 1.0, atol=0.01); NaN fails it
+    if not abs(total - 1.0) <= 0.01 + 1e-5:
+        raise ValueError(f"weights must sum to 1.0, got {total}")
+    
+    return weights
+
+
+def _calculate_beta_array(
+    physical: ArrayLike,
+    service: ArrayLike,
+    temporal: ArrayLike,
+    perpetuity: Optional[ArrayLike],
+    weights: Optional[Tuple[float, float, float]]
+) -> CompatibilityResult:
+    """
+    Vectorized β for array inputs.
+    
+    The three dimensions are stacked into a (3, ...) array so that
+    validation is a single pass and β is a single weighted sum.
+    """
+    X = np.stack(np.broadcast_arrays(
+        np.asarray(physical, dtype=float),
+        np.asarray(service, dtype=float),
+        np.asarray(temporal, dtype=float)
+    ))
+    
+    # Validate inputs
+    _check_unit_interval(X, ('physical', 'service', 'temporal'))
+    
+    if perpetuity is not None:
+        perpetuity = np.asarray(perpetuity, dtype=float)
+        _check_unit_interval(perpetuity[np.newaxis], ('perpetuity',))
+    
+    if weights is None or weights is _DEFAULT_WEIGHTS:
+        weights_array = _DEFAULT_WEIGHTS_ARRAY
+    else:
+        weights_array = np.asarray(_validate_weights(weights), dtype=float)
+    
+    # β = W · X over the leading (dimension) axis
+    beta = np.einsum('i,i...->...', weights_array, X)
+    
+    cooperation_potential = None
+    if perpetuity is not None:
+        cooperation_potential = perpetuity * beta
+    
+    return CompatibilityResult(
+        beta=beta,
+        physical=X[0],
+        service=X[1],
+        temporal=X[2],
+        perpetuity=perpetuity,
+        cooperation_potential=cooperation_potential
+    )
+
+
+def calculate_beta_batch(
+    physical: np.ndarray,
+    service: np.ndarray,
+    temporal: np.ndarray,
+    perpetuity: Optional[np.ndarray] = None,
+    weights: Optional[Tuple[float, float, float]] = None,
+    dtype: np.dtype = np.float64
+) -> CompatibilityResult:
+    """
+    Calculate β for many cases at once (e.g. Monte-Carlo sensitivity runs).
+    
+    Inputs are equal-length 1-D arrays, one per dimension (structure of
+    arrays). They are stacked into a single (3, N) array, validated in one
+    pass and reduced to β with one weighted sum. No interpretation text is
+    produced.
+    
+    Pass dtype=np.float32 for samples already held in single precision:
+    they are 0-1 values known to a couple of decimals, so nothing that is
+    reported is lost, and the memory traffic of large sweeps is halved.
+    Converting float64 inputs to float32 costs more than it saves.
+    
+    Parameters:
+        physical: Physical compatibility per case (0-1)
+        service: Service exchange quality per case (0-1)
+        temporal: Temporal coordination per case (0-1)
+        perpetuity: Sustainability factor φ per case (0-1), optional
+        weights: Optional (w_physical, w_service, w_temporal) weights
+            Default: (0.33, 0.33, 0.34) for equal weighting
+        dtype: Floating-point type for inputs and results (default float64)
+    
+    Returns:
+        CompatibilityResult whose fields are arrays:
+            - beta: Overall compatibility per case
+            - physical, service, temporal: The stacked inputs
+            - perpetuity: φ per case if provided, else None
+            - cooperation_potential: φ × β if perpetuity provided, else None
+        Its interpretation is only built if accessed.
+    
+    Examples:
+        >>> rng = np.random.default_rng(0)
+        >>> samples = rng.uniform(0.5, 1.0, size=(3, 100_000))
+        >>> result = calculate_beta_batch(*samples)
+        >>> result.beta.shape
+        (100000,)
+    """
+    X = np.stack([
+        np.asarray(physical, dtype=dtype),
+        np.asarray(service, dtype=dtype),
+        np.asarray(temporal, dtype=dtype)
+    ])
+    if X.ndim != 2:
+        raise ValueError(f"inputs must be 1-D arrays, got shape {X.shape[1:]}")
+    
+    _check_unit_interval(X, ('physical', 'service', 'temporal'))
+    
+    if weights is None or weights is _DEFAULT_WEIGHTS:
+        weights_array = _DEFAULT_WEIGHTS_ARRAY
+    else:
+        weights_array = np.asarray(_validate_weights(weights), dtype=np.float64)
+    
+    # β = W · X, in the working dtype (each β is a sum of only three terms)
+    beta = weights_array.astype(X.dtype) @ X
+    
+    cooperation_potential = None
+    if perpetuity is not None:
+        perpetuity = np.asarray(perpetuity, dtype=dtype)
+        _check_unit_interval(perpetuity[np.newaxis], ('perpetuity',))
+        cooperation_potential = perpetuity * beta
+    
+    return CompatibilityResult(
+        beta=beta,
+        physical=X[0],
+        service=X[1],
+        temporal=X[2],
+        perpetuity=perpetuity,
+        cooperation_potential=cooperation_potential
+    )
+
+
+def _check_unit_interval(X: np.ndarray, names: Tuple[str, ...]) -> None:
+    """Raise ValueError naming the first row of X with values outside [0, 1]."""
+    rows = X.reshape(len(X), -1)
+    if NUMBA_AVAILABLE:
+        if _first_outside_unit_interval(rows) < 0:
+            return
+    elif np.all((rows >= 0) & (rows <= 1)):
+        return
+    
+    for name, values in zip(names, rows):
+        bad = values[~((values >= 0) & (values <= 1))]
+        if bad.size:
+            raise ValueError(f"{name} must be in [0, 1], got {bad.flat[0]}")
+
+
+@njit(cache=True)
+def _first_outside_unit_interval(rows):
+    """
+    Index of the first column of rows holding a value outside [0, 1] (or
+    NaN), else -1. One pass over memory with no temporary arrays.
+    """
+    n_rows, n = rows.shape
+    for k in range(n):
+        for j in range(n_rows):
+            if not (0.0 <= rows[j, k] <= 1.0):
+                return k
+    return -1
 
 
 def _generate_beta_interpretation(
@@ -150,64 +592,30 @@ def _generate_beta_interpretation(
 ) -> str:
     """Generate human-readable interpretation of β results."""
     
-    interpretation = f"β (compatibility) = {beta:.2f}\n\n"
-    
-    # Overall compatibility assessment
-    if beta > 0.8:
-        interpretation += "EXCELLENT compatibility: "
-    elif beta > 0.6:
-        interpretation += "GOOD compatibility: "
-    elif beta > 0.4:
-        interpretation += "MODERATE compatibility: "
-    else:
-        interpretation += "LIMITED compatibility: "
-    
-    # Dimension breakdown
-    interpretation += f"\n\nDimension analysis:\n"
-    interpretation += f"• Physical: {physical:.2f} - "
-    if physical > 0.8:
-        interpretation += "Strong physical compatibility\n"
-    elif physical > 0.6:
-        interpretation += "Good physical match\n"
-    else:
-        interpretation += "Physical constraints present\n"
-    
-    interpretation += f"• Service: {service:.2f} - "
-    if service > 0.8:
-        interpretation += "Excellent service-need matching\n"
-    elif service > 0.6:
-        interpretation += "Services align reasonably well\n"
-    else:
-        interpretation += "Service-need mismatch detected\n"
-    
-    interpretation += f"• Temporal: {temporal:.2f} - "
-    if temporal > 0.8:
-        interpretation += "Strong temporal synchronization\n"
-    elif temporal > 0.6:
-        interpretation += "Adequate timing coordination\n"
-    else:
-        interpretation += "Temporal coordination challenges\n"
+    parts = [
+        f"β (compatibility) = {beta:.2f}\n\n",
+        # Overall compatibility assessment
+        _BETA_LABELS[bisect_left(_BETA_BOUNDS, beta)],
+        # Dimension breakdown
+        "\n\nDimension analysis:\n",
+        f"• Physical: {physical:.2f} - ",
+        _PHYS_LABELS[bisect_left(_DIMENSION_BOUNDS, physical)],
+        f"• Service: {service:.2f} - ",
+        _SERVICE_LABELS[bisect_left(_DIMENSION_BOUNDS, service)],
+        f"• Temporal: {temporal:.2f} - ",
+        _TEMPORAL_LABELS[bisect_left(_DIMENSION_BOUNDS, temporal)],
+    ]
     
     # Perpetuity and cooperation potential
     if perpetuity is not None:
-        interpretation += f"\nPerpetuit factor (φ) = {perpetuity:.2f} - "
-        if perpetuity > 0.8:
-            interpretation += "Highly sustainable relationship\n"
-        elif perpetuity > 0.6:
-            interpretation += "Reasonably sustainable\n"
-        else:
-            interpretation += "Sustainability concerns\n"
+        parts.append(f"\nPerpetuit factor (φ) = {perpetuity:.2f} - ")
+        parts.append(_PERP_LABELS[bisect_left(_DIMENSION_BOUNDS, perpetuity)])
         
         if coop_potential is not None:
-            interpretation += f"\nCooperation potential (φ × β) = {coop_potential:.2f}\n"
-            if coop_potential > 0.7:
-                interpretation += "Strong potential for lasting cooperation"
-            elif coop_potential > 0.5:
-                interpretation += "Moderate cooperation potential"
-            else:
-                interpretation += "Limited cooperation potential"
+            parts.append(f"\nCooperation potential (φ × β) = {coop_potential:.2f}\n")
+            parts.append(_COOP_LABELS[bisect_left(_COOP_BOUNDS, coop_potential)])
     
-    return interpretation
+    return "".join(parts)
 
 
 def combined_analysis(
@@ -216,7 +624,7 @@ def combined_analysis(
     perpetuity: Optional[float] = None,
     overlap: Optional[float] = None,
     differentiation: Optional[float] = None
-) -> Dict:
+) -> CombinedResult:
     """
     Perform combined MELV analysis with both i-factor and β-factor.
     
@@ -233,14 +641,18 @@ def combined_analysis(
         differentiation: Service differentiation (optional, for interpretation)
     
     Returns:
-        Dictionary containing:
+        CombinedResult (supports result['key'] access) containing:
             - i_factor: Interaction efficiency
             - beta: Compatibility
+            - regime: Regime implied by the i-factor
             - perpetuity: Sustainability (if provided)
             - cooperation_potential: φ × β (if perpetuity provided)
             - prediction: Overall regime prediction
             - confidence: Confidence level in prediction
-            - interpretation: Detailed analysis
+            - interpretation: Detailed analysis, generated lazily
+    
+    The inputs may be arrays, in which case regime, prediction and
+    confidence are returned as string arrays.
     
     Examples:
         >>> result = combined_analysis(
@@ -254,13 +666,16 @@ def combined_analysis(
         High
     """
     
+    if not (np.isscalar(i_factor) and np.isscalar(beta)
+            and (perpetuity is None or np.isscalar(perpetuity))
+            and (overlap is None or np.isscalar(overlap))
+            and (differentiation is None or np.isscalar(differentiation))):
+        return _combined_analysis_array(
+            i_factor, beta, perpetuity, overlap, differentiation
+        )
+    
     # Determine regime from i-factor
-    if i_factor < 1.0:
-        regime = "Cooperative"
-    elif abs(i_factor - 1.0) < 0.05:
-        regime = "Critical"
-    else:
-        regime = "Competitive"
+    regime = _REGIME_LABELS[bisect_right(_REGIME_BOUNDS, i_factor)]
     
     # Calculate cooperation potential
     cooperation_potential = None
@@ -272,22 +687,72 @@ def combined_analysis(
         i_factor, beta, perpetuity, cooperation_potential
     )
     
-    # Generate comprehensive interpretation
-    interpretation = _generate_combined_interpretation(
-        i_factor, beta, perpetuity, cooperation_potential,
-        regime, prediction, confidence,
-        overlap, differentiation
+    # Interpretation is generated on first access
+    return CombinedResult(
+        i_factor=i_factor,
+        beta=beta,
+        regime=regime,
+        prediction=prediction,
+        confidence=confidence,
+        perpetuity=perpetuity,
+        cooperation_potential=cooperation_potential,
+        overlap=overlap,
+        differentiation=differentiation
     )
+
+
+def _combined_analysis_array(
+    i_factor: ArrayLike,
+    beta: ArrayLike,
+    perpetuity: Optional[ArrayLike],
+    overlap: Optional[ArrayLike],
+    differentiation: Optional[ArrayLike]
+) -> CombinedResult:
+    """Vectorized combined analysis for array inputs."""
+    i_factor = np.asarray(i_factor, dtype=float)
+    beta = np.asarray(beta, dtype=float)
+    if perpetuity is not None:
+        perpetuity = np.asarray(perpetuity, dtype=float)
     
-    return {
-        'i_factor': i_factor,
-        'beta': beta,
-        'perpetuity': perpetuity,
-        'cooperation_potential': cooperation_potential,
-        'prediction': prediction,
-        'confidence': confidence,
-        'interpretation': interpretation
-    }
+    # Predictions take the joint shape of i-factor, β and perpetuity
+    shape = np.broadcast_shapes(i_factor.shape, beta.shape, np.shape(perpetuity))
+    i_factor = np.broadcast_to(i_factor, shape)
+    beta = np.broadcast_to(beta, shape)
+    
+    regime = np.asarray(_REGIME_LABELS)[
+        np.searchsorted(_REGIME_BOUNDS, i_factor, side='right')
+    ]
+    
+    cooperation_potential = None
+    if perpetuity is not None:
+        cooperation_potential = perpetuity * beta
+        perp_flat = np.broadcast_to(perpetuity, i_factor.shape).ravel()
+        coop_flat = np.broadcast_to(cooperation_potential, i_factor.shape).ravel()
+    else:
+        perp_flat = np.full(i_factor.size, -1.0)
+        coop_flat = perp_flat
+    
+    pred_codes = np.empty(i_factor.size, dtype=np.int8)
+    conf_codes = np.empty(i_factor.size, dtype=np.int8)
+    _predict_codes_batch(
+        np.ascontiguousarray(i_factor).ravel(),
+        np.ascontiguousarray(beta).ravel(),
+        np.ascontiguousarray(perp_flat),
+        np.ascontiguousarray(coop_flat),
+        pred_codes, conf_codes
+    )
+    
+    return CombinedResult(
+        i_factor=i_factor,
+        beta=beta,
+        regime=regime,
+        prediction=np.asarray(PRED_TABLE)[pred_codes].reshape(i_factor.shape),
+        confidence=np.asarray(CONF_TABLE)[conf_codes].reshape(i_factor.shape),
+        perpetuity=perpetuity,
+        cooperation_potential=cooperation_potential,
+        overlap=overlap,
+        differentiation=differentiation
+    )
 
 
 def _make_prediction(
@@ -297,37 +762,165 @@ def _make_prediction(
     coop_potential: Optional[float]
 ) -> Tuple[str, str]:
     """Generate prediction and confidence level."""
+    return _PREDICTION_PAIRS[_predict_codes_scalar(
+        i_factor,
+        beta,
+        -1.0 if perpetuity is None else perpetuity,
+        -1.0 if coop_potential is None else coop_potential
+    )]
+
+
+@njit(cache=True)
+def _predict_codes(i_factor, beta, perpetuity, coop_potential):
+    """
+    Prediction decision tree as (PRED_TABLE, CONF_TABLE) index codes.
     
+    Numeric only so it can be JIT-compiled; a perpetuity or cooperation
+    potential of -1.0 means "not provided".
+    """
     # Case 1: Strong cooperation conditions
     if i_factor < 0.7 and beta > 0.7:
-        if coop_potential is not None and coop_potential > 0.6:
-            return "Stable cooperation", "High"
+        if coop_potential > 0.6:
+            return 0, 0  # Stable cooperation, High
         elif beta > 0.8:
-            return "Stable cooperation", "Moderate"
+            return 0, 1  # Stable cooperation, Moderate
         else:
-            return "Cooperation likely", "Moderate"
+            return 1, 1  # Cooperation likely, Moderate
     
     # Case 2: Moderate cooperation conditions
     elif i_factor < 1.0 and beta > 0.5:
-        if coop_potential is not None and coop_potential > 0.5:
-            return "Cooperation with fluctuations", "Moderate"
+        if coop_potential > 0.5:
+            return 2, 1  # Cooperation with fluctuations, Moderate
         else:
-            return "Cooperation possible", "Low to Moderate"
+            return 3, 2  # Cooperation possible, Low to Moderate
     
     # Case 3: Critical threshold
     elif abs(i_factor - 1.0) < 0.1:
-        return "Unstable regime (near critical point)", "Low"
+        return 4, 3  # Unstable regime, Low
     
     # Case 4: Competition
     elif i_factor > 1.0:
         if i_factor < 1.3:
-            return "Mild competition", "Moderate"
+            return 5, 1  # Mild competition, Moderate
         else:
-            return "Strong competition", "High"
+            return 6, 0  # Strong competition, High
     
     # Case 5: Cooperation with poor compatibility
     else:  # i < 1 but β low
-        return "Cooperation possible but inefficient", "Low"
+        return 7, 3  # Cooperation possible but inefficient, Low
+
+
+# A single prediction is cheaper as plain Python than through Numba's
+# dispatcher; only the batch kernels below call the compiled version
+_predict_codes_scalar = getattr(_predict_codes, 'py_func', _predict_codes)
+
+
+@njit(parallel=True, cache=True)
+def _predict_codes_batch(i_factor, beta, perpetuity, coop_potential,
+                         out_pred, out_conf):
+    """Apply _predict_codes elementwise, writing into the output arrays."""
+    for k in prange(i_factor.size):
+        pred, conf = _predict_codes(
+            i_factor[k], beta[k], perpetuity[k], coop_potential[k]
+        )
+        out_pred[k] = pred
+        out_conf[k] = conf
+
+
+def calculate_beta_and_combined(
+    physical: np.ndarray,
+    service: np.ndarray,
+    temporal: np.ndarray,
+    perpetuity: np.ndarray,
+    i_factor: np.ndarray,
+    weights: Optional[Tuple[float, float, float]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    β-factor and combined prediction for many entity pairs in one pass.
+    
+    Intended for agent-based sweeps: each position k of the input arrays
+    describes one pair. β, φ × β and the prediction are computed together
+    by a single (parallel, when Numba is installed) loop, without building
+    a result object or interpretation per pair.
+    
+    Predictions are returned as integer codes; look them up in PRED_TABLE
+    and CONF_TABLE only where strings are needed.
+    
+    Parameters:
+        physical: Physical compatibility per pair (0-1)
+        service: Service exchange quality per pair (0-1)
+        temporal: Temporal coordination per pair (0-1)
+        perpetuity: Sustainability factor φ per pair (0-1)
+        i_factor: Interaction efficiency factor per pair
+        weights: Optional (w_physical, w_service, w_temporal) weights
+            Default: (0.33, 0.33, 0.34) for equal weighting
+    
+    Returns:
+        Dictionary of arrays:
+            - beta: Compatibility per pair
+            - cooperation_potential: φ × β per pair
+            - prediction_code: Index into PRED_TABLE
+            - confidence_code: Index into CONF_TABLE
+    
+    Examples:
+        >>> result = calculate_beta_and_combined(
+        ...     physical=np.array([0.85, 0.40]),
+        ...     service=np.array([0.90, 0.50]),
+        ...     temporal=np.array([0.75, 0.60]),
+        ...     perpetuity=np.array([0.88, 0.50]),
+        ...     i_factor=np.array([0.35, 1.60])
+        ... )
+        >>> [PRED_TABLE[code] for code in result['prediction_code']]
+        ['Stable cooperation', 'Strong competition']
+    """
+    X = np.stack([
+        np.asarray(physical, dtype=np.float64),
+        np.asarray(service, dtype=np.float64),
+        np.asarray(temporal, dtype=np.float64),
+        np.asarray(perpetuity, dtype=np.float64)
+    ])
+    if X.ndim != 2:
+        raise ValueError(f"inputs must be 1-D arrays, got shape {X.shape[1:]}")
+    _check_unit_interval(X, ('physical', 'service', 'temporal', 'perpetuity'))
+    
+    i_factor = np.ascontiguousarray(i_factor, dtype=np.float64)
+    if i_factor.shape != X.shape[1:]:
+        raise ValueError(
+            f"i_factor must have shape {X.shape[1:]}, got {i_factor.shape}"
+        )
+    
+    w0, w1, w2 = _validate_weights(weights)
+    
+    n = X.shape[1]
+    out_beta = np.empty(n)
+    out_coop = np.empty(n)
+    out_pred = np.empty(n, dtype=np.int8)
+    out_conf = np.empty(n, dtype=np.int8)
+    _melv_sweep(
+        X[0], X[1], X[2], X[3], i_factor, w0, w1, w2,
+        out_beta, out_coop, out_pred, out_conf
+    )
+    
+    return {
+        'beta': out_beta,
+        'cooperation_potential': out_coop,
+        'prediction_code': out_pred,
+        'confidence_code': out_conf
+    }
+
+
+@njit(parallel=True, cache=True)
+def _melv_sweep(physical, service, temporal, perpetuity, i_factor,
+                w0, w1, w2, out_beta, out_coop, out_pred, out_conf):
+    """Fused β, φ × β and prediction kernel behind calculate_beta_and_combined."""
+    for k in prange(i_factor.size):
+        beta = w0 * physical[k] + w1 * service[k] + w2 * temporal[k]
+        coop = perpetuity[k] * beta
+        out_beta[k] = beta
+        out_coop[k] = coop
+        pred, conf = _predict_codes(i_factor[k], beta, perpetuity[k], coop)
+        out_pred[k] = pred
+        out_conf[k] = conf
 
 
 def _generate_combined_interpretation(
@@ -343,60 +936,33 @@ def _generate_combined_interpretation(
 ) -> str:
     """Generate comprehensive interpretation of combined analysis."""
     
-    interpretation = "=== COMBINED MELV ANALYSIS ===\n\n"
-    
     # i-factor analysis
-    interpretation += f"i-factor = {i_factor:.2f} → {regime} regime\n"
+    parts = [f"=== COMBINED MELV ANALYSIS ===\n\ni-factor = {i_factor:.2f} → {regime} regime\n"]
     if overlap is not None and differentiation is not None:
-        interpretation += f"  (overlap: {overlap:.2f}, differentiation: {differentiation:.2f})\n"
-    
-    if i_factor < 1.0:
-        interpretation += "  ✓ Interaction costs below critical threshold\n"
-        interpretation += "  ✓ Cooperation is energetically favorable\n"
-    else:
-        interpretation += "  ✗ Interaction costs exceed benefits\n"
-        interpretation += "  ✗ Competition is energetically favorable\n"
+        parts.append(f"  (overlap: {overlap:.2f}, differentiation: {differentiation:.2f})\n")
+    parts.append(_COMBINED_I_LABELS[i_factor < 1.0])
     
     # β-factor analysis
-    interpretation += f"\nβ (compatibility) = {beta:.2f}\n"
-    if beta > 0.7:
-        interpretation += "  ✓ High compatibility for cooperation\n"
-    elif beta > 0.5:
-        interpretation += "  ~ Moderate compatibility\n"
-    else:
-        interpretation += "  ✗ Limited compatibility\n"
+    parts.append(f"\nβ (compatibility) = {beta:.2f}\n")
+    parts.append(_COMBINED_BETA_LABELS[bisect_left(_COMBINED_BETA_BOUNDS, beta)])
     
     # Perpetuity and cooperation potential
     if perpetuity is not None:
-        interpretation += f"\nφ (perpetuity) = {perpetuity:.2f}\n"
+        parts.append(f"\nφ (perpetuity) = {perpetuity:.2f}\n")
         if coop_potential is not None:
-            interpretation += f"Cooperation potential (φ × β) = {coop_potential:.2f}\n"
+            parts.append(f"Cooperation potential (φ × β) = {coop_potential:.2f}\n")
     
     # Prediction
-    interpretation += f"\n=== PREDICTION ===\n"
-    interpretation += f"{prediction}\n"
-    interpretation += f"Confidence: {confidence}\n\n"
+    parts.append(f"\n=== PREDICTION ===\n{prediction}\nConfidence: {confidence}\n\n")
     
     # Explanation
     if i_factor < 1.0 and beta > 0.6:
-        interpretation += (
-            "Both conditions favor cooperation: low interaction costs (i < 1) "
-            "and good compatibility (β > 0.6). Expect cooperative dynamics.\n"
-        )
+        parts.append(_EXPLANATIONS[0])
     elif i_factor < 1.0 and beta < 0.6:
-        interpretation += (
-            "Low interaction costs favor cooperation, but poor compatibility "
-            "limits effectiveness. Cooperation may emerge but be inefficient.\n"
-        )
+        parts.append(_EXPLANATIONS[1])
     elif i_factor > 1.0:
-        interpretation += (
-            "High interaction costs (i > 1) create competitive pressure. "
-            "Even with good compatibility, cooperation is unlikely to emerge.\n"
-        )
+        parts.append(_EXPLANATIONS[2])
     else:
-        interpretation += (
-            "System near critical threshold. Outcomes highly sensitive to "
-            "small parameter changes. Monitor closely for regime shifts.\n"
-        )
+        parts.append(_EXPLANATIONS[3])
     
-    return interpretation
+    return "".join(parts)
@@ -18,23 +18,54 @@ License: MIT
 Version: 0.1.0
 """
 
+import multiprocessing
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional, Union
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 
+from ._jit import NUMBA_AVAILABLE, njit
+from .compatibility import _SLOTS, _result_dict, _result_has, _result_item
 
-@dataclass
+# Anything np.random.default_rng accepts as a seed
+RandomSeed = Optional[Union[int, np.random.SeedSequence, np.random.Generator]]
+
+# Marks an interpretation that has not been built yet
+_LAZY = object()
+
+# Largest spatial grid (in cells) whose position indices are cached
+_POSITIONS_CACHE_MAX = 1 << 16
+
+# Largest block of normals drawn at once when bootstrapping many interactions
+_BATCH_DRAW_LIMIT = 1 << 22
+
+# Interaction keys that compare_multiple_interactions can calculate in batches
+_BATCH_KEYS = frozenset({'overlap', 'differentiation', 'uncertainty', 'bootstrap_n'})
+
+# Regime by bisect_left / searchsorted(side='left') on the i-factor: this
+# reproduces the strict bounds of abs(i - 1) < 0.05 exactly
+_REGIME_BOUNDS = (0.95, float(np.nextafter(1.05, 0.0)))
+_REGIME_NAMES = ('Cooperative', 'Critical (near threshold)', 'Competitive')
+
+
+@dataclass(init=False)
 class InteractionResult:
     """
     Results from i-factor calculation.
     
+    Supports dict-style access (result['i_factor']) as well as attributes;
+    to_dict() gives a plain dictionary.
+    
     Attributes:
         i_factor: The interaction factor value
         overlap: Resource overlap coefficient (0-1)
         differentiation: Service differentiation coefficient (0-1)
         regime: 'Cooperative' or 'Competitive'
         confidence_interval: (lower, upper) bounds if uncertainty analysis performed
-        interpretation: Human-readable explanation
+        interpretation: Human-readable explanation, built on first access
+            unless given (None if disabled with include_interpretation=False)
         method: Calculation method used
     """
     i_factor: float
@@ -42,8 +73,119 @@ class InteractionResult:
     differentiation: float
     regime: str
     confidence_interval: Optional[Tuple[float, float]] = None
-    interpretation: str = ""
     method: str = "direct"
+    
+    def __init__(
+        self,
+        i_factor: float,
+        overlap: float,
+        differentiation: float,
+        regime: str,
+        confidence_interval: Optional[Tuple[float, float]] = None,
+        interpretation: Optional[str] = None,
+        method: str = "direct"
+    ):
+        # Written out so that interpretation keeps its place among the
+        # arguments, as in earlier versions; when omitted it is built on
+        # first access. It is kept out of the dataclass fields, so that
+        # asdict() and replace() see only the results
+        self.i_factor = i_factor
+        self.overlap = overlap
+        self.differentiation = differentiation
+        self.regime = regime
+        self.confidence_interval = confidence_interval
+        self.method = method
+        self._interpretation = _LAZY if interpretation is None else interpretation
+    
+    @property
+    def interpretation(self) -> Optional[str]:
+        """Human-readable explanation of the result."""
+        if self._interpretation is _LAZY:
+            self._interpretation = _generate_interpretation(
+                self.i_factor, self.overlap, self.differentiation,
+                self.regime, self.method
+            )
+        return self._interpretation
+    
+    def __getitem__(self, key: str):
+        return _result_item(self, key)
+    
+    def __contains__(self, key) -> bool:
+        return _result_has(self, key)
+    
+    def to_dict(self, include_interpretation: bool = True) -> Dict:
+        """Plain dict of the results, as returned by earlier versions."""
+        return _result_dict(self, include_interpretation)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class InteractionResultArray:
+    """
+    Results for many interactions, held as parallel arrays.
+    
+    Returned by compare_multiple_interactions. Row k of every field
+    describes the same interaction. Indexing, iterating or to_results()
+    gives InteractionResult objects, built only as they are requested;
+    slicing gives another InteractionResultArray.
+    
+    Attributes:
+        i_factor: Interaction factor values
+        overlap: Resource overlap coefficients (0-1)
+        differentiation: Service differentiation coefficients (0-1)
+        regime_code: Regime of each row as an index into regime names (int8)
+        names: (entity1, entity2) name pairs
+        confidence_interval: (N, 2) bounds, NaN where none was calculated
+        method: Calculation method used for each row
+        regime: Regime names, decoded from regime_code
+    """
+    i_factor: np.ndarray
+    overlap: np.ndarray
+    differentiation: np.ndarray
+    regime_code: np.ndarray
+    names: List[Tuple[str, str]]
+    confidence_interval: np.ndarray
+    method: List[str]
+    
+    @property
+    def regime(self) -> np.ndarray:
+        """Regime name of each row."""
+        return np.asarray(_REGIME_NAMES)[self.regime_code]
+    
+    def __len__(self) -> int:
+        return len(self.i_factor)
+    
+    def __iter__(self) -> Iterator[InteractionResult]:
+        return self.to_results()
+    
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[InteractionResult, 'InteractionResultArray']:
+        if isinstance(index, slice):
+            return InteractionResultArray(
+                i_factor=self.i_factor[index],
+                overlap=self.overlap[index],
+                differentiation=self.differentiation[index],
+                regime_code=self.regime_code[index],
+                names=self.names[index],
+                confidence_interval=self.confidence_interval[index],
+                method=self.method[index]
+            )
+        return self._result(range(len(self))[index])
+    
+    def to_results(self) -> Iterator[InteractionResult]:
+        """InteractionResult for each row in turn, created on demand."""
+        return (self._result(k) for k in range(len(self)))
+    
+    def _result(self, k: int) -> InteractionResult:
+        lower, upper = self.confidence_interval[k].tolist()
+        return InteractionResult(
+            i_factor=self.i_factor[k].item(),
+            overlap=self.overlap[k].item(),
+            differentiation=self.differentiation[k].item(),
+            regime=_REGIME_NAMES[self.regime_code[k]],
+            confidence_interval=None if np.isnan(lower) else (lower, upper),
+            method=self.method[k]
+        )
 
 
 def calculate_i_factor(
@@ -54,8 +196,11 @@ def calculate_i_factor(
     spatial_patterns: Optional[Tuple[np.ndarray, np.ndarray]] = None,
     uncertainty: Optional[float] = None,
     bootstrap_n: int = 1000,
-    random_state: Optional[int] = None
-) -> Dict:
+    random_state: RandomSeed = None,
+    include_interpretation: bool = True,
+    dtype: np.dtype = np.float64,
+    low_memory_bootstrap: bool = False
+) -> InteractionResult:
     """
     Calculate the i-factor from various input types.
     
@@ -76,10 +221,21 @@ def calculate_i_factor(
         spatial_patterns: Tuple of (entity1_locations, entity2_locations)
         uncertainty: Standard error for bootstrap confidence intervals
         bootstrap_n: Number of bootstrap samples (default 1000)
-        random_state: Random seed for reproducibility
+        random_state: Random seed for reproducibility (an int, SeedSequence
+            or Generator)
+        include_interpretation: If False, interpretation is None rather than
+            being generated on first access
+        dtype: Floating-point type for resource, temporal and spatial inputs
+            (default float64). float32 halves memory traffic on large inputs
+            and agrees to about 1e-6, except that temporal peaks closer than
+            float32 resolution may resolve to a different position
+        low_memory_bootstrap: If True and Numba is installed, draw bootstrap
+            samples in a compiled loop instead of one (bootstrap_n, 2) array.
+            The kernel uses its own random stream, so the same random_state
+            gives a different (statistically equivalent) interval
     
     Returns:
-        Dictionary containing:
+        InteractionResult, also readable as a dictionary, containing:
             - i_factor: The calculated value
             - overlap: Resource overlap
             - differentiation: Service differentiation
@@ -106,20 +262,28 @@ def calculate_i_factor(
         95% CI: [0.28, 0.42]
     """
     
-    if random_state is not None:
-        np.random.seed(random_state)
-    
     # Determine calculation method
     if overlap is not None and differentiation is not None:
+        # Validate inputs (the other methods clip into range themselves)
+        if not (0 <= overlap <= 1):
+            raise ValueError(f"Overlap must be in [0, 1], got {overlap}")
+        if not (0 < differentiation <= 1):
+            raise ValueError(f"Differentiation must be in (0, 1], got {differentiation}")
         method = "direct"
     elif resource_vectors is not None:
-        overlap, differentiation = _calculate_from_resources(resource_vectors)
+        overlap, differentiation = _calculate_from_resources(
+            resource_vectors, dtype
+        )
         method = "resource_vectors"
     elif temporal_patterns is not None:
-        overlap, differentiation = _calculate_from_temporal(temporal_patterns)
+        overlap, differentiation = _calculate_from_temporal(
+            temporal_patterns, dtype
+        )
         method = "temporal"
     elif spatial_patterns is not None:
-        overlap, differentiation = _calculate_from_spatial(spatial_patterns)
+        overlap, differentiation = _calculate_from_spatial(
+            spatial_patterns, dtype
+        )
         method = "spatial"
     else:
         raise ValueError(
@@ -127,45 +291,98 @@ def calculate_i_factor(
             "temporal_patterns, or spatial_patterns"
         )
     
-    # Validate inputs
-    if not (0 <= overlap <= 1):
-        raise ValueError(f"Overlap must be in [0, 1], got {overlap}")
-    if not (0 < differentiation <= 1):
-        raise ValueError(f"Differentiation must be in (0, 1], got {differentiation}")
-    
     # Calculate i-factor
     i_factor = overlap / differentiation
     
     # Determine regime
-    regime = "Cooperative" if i_factor < 1.0 else "Competitive"
-    if abs(i_factor - 1.0) < 0.05:
-        regime = "Critical (near threshold)"
+    regime = _REGIME_NAMES[bisect_left(_REGIME_BOUNDS, i_factor)]
     
     # Bootstrap confidence interval if uncertainty provided
     confidence_interval = None
     if uncertainty is not None and uncertainty > 0:
+        # Local generator: no global NumPy random state is touched
+        rng = np.random.default_rng(random_state)
         confidence_interval = _bootstrap_confidence_interval(
-            overlap, differentiation, uncertainty, bootstrap_n
+            overlap, differentiation, uncertainty, bootstrap_n, rng,
+            low_memory=low_memory_bootstrap
         )
     
-    # Generate interpretation
-    interpretation = _generate_interpretation(
-        i_factor, overlap, differentiation, regime, method
+    result = InteractionResult(
+        i_factor=i_factor,
+        overlap=overlap,
+        differentiation=differentiation,
+        regime=regime,
+        confidence_interval=confidence_interval,
+        method=method
     )
     
+    # Interpretation is generated on first access, unless disabled
+    if not include_interpretation:
+        result._interpretation = None
+    
+    return result
+
+
+def calculate_i_factor_batch(
+    overlaps: np.ndarray,
+    differentiations: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate i-factors for many (overlap, differentiation) pairs at once.
+    
+    Vectorized form of the direct method of calculate_i_factor: inputs are
+    validated and divided as whole arrays, and regimes are assigned with the
+    same rules. No interpretation text is generated.
+    
+    Parameters:
+        overlaps: Resource overlap coefficients (0-1)
+        differentiations: Service differentiation coefficients (0-1)
+    
+    Returns:
+        Dictionary of arrays: i_factor, overlap, differentiation, regime
+    
+    Examples:
+        >>> result = calculate_i_factor_batch([0.3, 0.7], [0.85, 0.4])
+        >>> result['regime'].tolist()
+        ['Cooperative', 'Competitive']
+    """
+    overlaps = np.asarray(overlaps, dtype=np.float64)
+    differentiations = np.asarray(differentiations, dtype=np.float64)
+    
+    # Validate inputs
+    bad = ~((overlaps >= 0) & (overlaps <= 1))
+    if bad.any():
+        raise ValueError(
+            f"Overlap must be in [0, 1], got {overlaps[bad].flat[0]}"
+        )
+    bad = ~((differentiations > 0) & (differentiations <= 1))
+    if bad.any():
+        raise ValueError(
+            f"Differentiation must be in (0, 1], got {differentiations[bad].flat[0]}"
+        )
+    
+    # Calculate i-factors
+    i_factor = overlaps / differentiations
+    
+    # Determine regimes
+    regime = np.asarray(_REGIME_NAMES)[_regime_codes(i_factor)]
+    
     return {
         'i_factor': i_factor,
-        'overlap': overlap,
-        'differentiation': differentiation,
-        'regime': regime,
-        'confidence_interval': confidence_interval,
-        'interpretation': interpretation,
-        'method': method
+        'overlap': overlaps,
+        'differentiation': differentiations,
+        'regime': regime
     }
 
 
+def _regime_codes(i_factor: np.ndarray) -> np.ndarray:
+    """Index into _REGIME_NAMES of each i-factor's regime, as int8."""
+    return np.searchsorted(_REGIME_BOUNDS, i_factor, side='left').astype(np.int8)
+
+
 def _calculate_from_resources(
-    resource_vectors: Tuple[np.ndarray, np.ndarray]
+    resource_vectors: Tuple[np.ndarray, np.ndarray],
+    dtype: np.dtype = np.float64
 ) -> Tuple[float, float]:
     """
     Calculate overlap and differentiation from resource usage vectors.
@@ -178,18 +395,23 @@ def _calculate_from_resources(
     if len(r1) != len(r2):
         raise ValueError("Resource vectors must have same length")
     
-    # Normalize vectors
-    r1_norm = r1 / (np.linalg.norm(r1) + 1e-10)
-    r2_norm = r2 / (np.linalg.norm(r2) + 1e-10)
+    r1 = np.ascontiguousarray(r1, dtype=dtype)
+    r2 = np.ascontiguousarray(r2, dtype=dtype)
+    if r1.ndim != 1 or r2.ndim != 1:
+        raise ValueError("Resource vectors must be 1-D")
     
-    # Overlap as cosine similarity
-    overlap = float(np.dot(r1_norm, r2_norm))
+    # Overlap as cosine similarity, from dot products (no normalized copies)
+    dot = np.vdot(r1, r2)
+    na2 = np.vdot(r1, r1)
+    nb2 = np.vdot(r2, r2)
+    overlap = float(dot / (np.sqrt(na2 * nb2) + 1e-10))
     overlap = max(0.0, min(1.0, overlap))  # Ensure [0, 1]
     
-    # Differentiation as 1 - correlation
-    if np.std(r1) > 0 and np.std(r2) > 0:
-        correlation = np.corrcoef(r1, r2)[0, 1]
-        differentiation = 1.0 - abs(correlation)
+    # Differentiation as 1 - correlation (Pearson, from centered sums)
+    sxx, syy, sxy = _centered_sums(r1, r1.mean(), r2, r2.mean())
+    if sxx > 0 and syy > 0:
+        correlation = min(1.0, float(abs(sxy / np.sqrt(sxx * syy))))
+        differentiation = 1.0 - correlation
     else:
         differentiation = 0.5  # Default if no variation
     
@@ -199,7 +421,8 @@ def _calculate_from_resources(
 
 
 def _calculate_from_temporal(
-    temporal_patterns: Tuple[np.ndarray, np.ndarray]
+    temporal_patterns: Tuple[np.ndarray, np.ndarray],
+    dtype: np.dtype = np.float64
 ) -> Tuple[float, float]:
     """
     Calculate overlap and differentiation from temporal activity patterns.
@@ -211,29 +434,102 @@ def _calculate_from_temporal(
     
     if len(t1) != len(t2):
         raise ValueError("Temporal patterns must have same length")
+    if len(t1) == 0:
+        raise ValueError("Temporal patterns must not be empty")
+    
+    t1 = np.ascontiguousarray(t1, dtype=dtype)
+    t2 = np.ascontiguousarray(t2, dtype=dtype)
+    if t1.ndim != 1 or t2.ndim != 1:
+        raise ValueError("Temporal patterns must be 1-D")
+    
+    # Range, mean and peak of each pattern. Correlation and peak position
+    # are unchanged by normalizing to [0, 1], so the raw data is used.
+    if NUMBA_AVAILABLE:
+        min1, max1, mean1, peak1 = _temporal_stats(t1)
+        min2, max2, mean2, peak2 = _temporal_stats(t2)
+    else:
+        min1, max1, mean1, peak1 = t1.min(), t1.max(), t1.mean(), t1.argmax()
+        min2, max2, mean2, peak2 = t2.min(), t2.max(), t2.mean(), t2.argmax()
     
-    # Normalize to [0, 1]
-    t1_norm = (t1 - np.min(t1)) / (np.max(t1) - np.min(t1) + 1e-10)
-    t2_norm = (t2 - np.min(t2)) / (np.max(t2) - np.min(t2) + 1e-10)
+    # NaN propagates into min/max and infinities reach them, so this checks
+    # every value without another pass
+    if not np.isfinite((min1, max1, min2, max2)).all():
+        raise ValueError("Temporal patterns must be finite")
     
     # Overlap as temporal correlation
-    if np.std(t1_norm) > 0 and np.std(t2_norm) > 0:
-        overlap = float(abs(np.corrcoef(t1_norm, t2_norm)[0, 1]))
+    if max1 > min1 and max2 > min2:
+        sxx, syy, sxy = _centered_sums(t1, mean1, t2, mean2)
+        overlap = min(1.0, float(abs(sxy / np.sqrt(sxx * syy))))
     else:
         overlap = 0.5
     
     # Differentiation as peak separation
-    peak1 = np.argmax(t1_norm)
-    peak2 = np.argmax(t2_norm)
-    peak_separation = abs(peak1 - peak2) / len(t1)
+    peak_separation = abs(int(peak1) - int(peak2)) / len(t1)
     differentiation = float(peak_separation)
     differentiation = max(0.1, min(1.0, differentiation))
     
     return overlap, differentiation
 
 
+@njit(cache=True)
+def _temporal_stats(t):
+    """
+    (min, max, mean, argmax) of a 1-D array in a single pass. The argmax is
+    the first occurrence of the maximum, as with np.argmax; a NaN makes
+    every statistic NaN, as with NumPy's reductions.
+    """
+    tmin = t[0]
+    tmax = t[0]
+    peak = 0
+    total = 0.0
+    for k in range(t.size):
+        v = t[k]
+        if np.isnan(v):
+            return v, v, v, k
+        total += v
+        if v < tmin:
+            tmin = v
+        if v > tmax:
+            tmax = v
+            peak = k
+    return tmin, tmax, total / t.size, peak
+
+
+def _centered_sums(
+    x: np.ndarray,
+    x_mean: float,
+    y: np.ndarray,
+    y_mean: float
+) -> Tuple[float, float, float]:
+    """(Sxx, Syy, Sxy) about the given means, fused into one pass with Numba."""
+    if NUMBA_AVAILABLE:
+        return _centered_moments(x, x_mean, y, y_mean)
+    dx = x - x_mean
+    dy = y - y_mean
+    return np.vdot(dx, dx), np.vdot(dy, dy), np.vdot(dx, dy)
+
+
+@njit(cache=True)
+def _centered_moments(x, x_mean, y, y_mean):
+    """
+    Sums of squares and cross-products about the means, (Sxx, Syy, Sxy),
+    in one pass over both arrays.
+    """
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    for k in range(x.size):
+        dx = x[k] - x_mean
+        dy = y[k] - y_mean
+        sxx += dx * dx
+        syy += dy * dy
+        sxy += dx * dy
+    return sxx, syy, sxy
+
+
 def _calculate_from_spatial(
-    spatial_patterns: Tuple[np.ndarray, np.ndarray]
+    spatial_patterns: Tuple[np.ndarray, np.ndarray],
+    dtype: np.dtype = np.float64
 ) -> Tuple[float, float]:
     """
     Calculate overlap and differentiation from spatial distributions.
@@ -245,23 +541,33 @@ def _calculate_from_spatial(
     
     if s1.shape != s2.shape:
         raise ValueError("Spatial patterns must have same shape")
-    
-    # Flatten for analysis
-    s1_flat = s1.flatten()
-    s2_flat = s2.flatten()
-    
-    # Normalize
-    s1_norm = s1_flat / (np.sum(s1_flat) + 1e-10)
-    s2_norm = s2_flat / (np.sum(s2_flat) + 1e-10)
-    
-    # Overlap as spatial correlation
-    overlap = float(np.sum(np.minimum(s1_norm, s2_norm)))
+    if np.size(s1) == 0:
+        raise ValueError("Spatial patterns must not be empty")
+    
+    # Flatten for analysis (a view of the contiguous working copy)
+    s1_flat = np.ascontiguousarray(s1, dtype=dtype).ravel()
+    s2_flat = np.ascontiguousarray(s2, dtype=dtype).ravel()
+    
+    # Densities: negative or NaN cells would yield a meaningless overlap
+    if not (s1_flat.min() >= 0 and s2_flat.min() >= 0):
+        raise ValueError("Spatial patterns must be non-negative")
+    
+    # Totals used to normalize each distribution
+    total1 = np.sum(s1_flat) + 1e-10
+    total2 = np.sum(s2_flat) + 1e-10
+    
+    # Overlap as spatial correlation: sum of min(s1/total1, s2/total2),
+    # computed as sum(min(s1 * total2/total1, s2)) / total2 in one buffer
+    shared = np.multiply(s1_flat, total2 / total1)
+    np.minimum(shared, s2_flat, out=shared)
+    overlap = float(np.sum(shared) / total2)
+    overlap = max(0.0, min(1.0, overlap))  # Ensure [0, 1]
     
     # Differentiation as spatial separation
     # Calculate center of mass for each distribution
-    indices = np.arange(len(s1_flat))
-    center1 = np.sum(indices * s1_norm)
-    center2 = np.sum(indices * s2_norm)
+    indices = _positions(len(s1_flat), s1_flat.dtype)
+    center1 = np.dot(indices, s1_flat) / total1
+    center2 = np.dot(indices, s2_flat) / total2
     separation = abs(center1 - center2) / len(s1_flat)
     differentiation = float(separation)
     differentiation = max(0.1, min(1.0, differentiation))
@@ -269,11 +575,32 @@ def _calculate_from_spatial(
     return overlap, differentiation
 
 
+def _positions(n: int, dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Read-only 0..n-1. Small grids share a cached array; for large ones a
+    fresh arange is cheap next to the dot products, and caching it would
+    pin the memory for the life of the process.
+    """
+    if n > _POSITIONS_CACHE_MAX:
+        return np.arange(n, dtype=dtype)
+    return _cached_positions(n, dtype)
+
+
+@lru_cache(maxsize=32)
+def _cached_positions(n: int, dtype: np.dtype) -> np.ndarray:
+    """0..n-1 as a read-only array, shared by calls with the same size and dtype."""
+    positions = np.arange(n, dtype=dtype)
+    positions.flags.writeable = False
+    return positions
+
+
 def _bootstrap_confidence_interval(
     overlap: float,
     differentiation: float,
     uncertainty: float,
-    n_samples: int
+    n_samples: int,
+    rng: np.random.Generator,
+    low_memory: bool = False
 ) -> Tuple[float, float]:
     """
     Calculate bootstrap confidence interval for i-factor.
@@ -281,22 +608,114 @@ def _bootstrap_confidence_interval(
     Assumes normal distributions for overlap and differentiation
     with given uncertainty (standard error).
     """
-    # Generate samples
-    overlap_samples = np.random.normal(overlap, uncertainty, n_samples)
-    diff_samples = np.random.normal(differentiation, uncertainty, n_samples)
-    
-    # Clip to valid ranges
-    overlap_samples = np.clip(overlap_samples, 0, 1)
-    diff_samples = np.clip(diff_samples, 0.01, 1)  # Avoid division by zero
+    if low_memory and NUMBA_AVAILABLE:
+        # Draw, clip and divide in one compiled loop, seeded from rng
+        i_samples = _bootstrap_njit(
+            overlap, differentiation, uncertainty, n_samples,
+            int(rng.integers(2**32))
+        )
+        ci_lower, ci_upper = _quantiles_inplace(i_samples, (0.025, 0.975))
+        return (float(ci_lower), float(ci_upper))
+    
+    # Generate overlap (row 0) and differentiation (row 1) samples in a
+    # single draw, scaled and shifted in place
+    samples = rng.standard_normal(size=(2, n_samples))
+    samples *= uncertainty
+    overlap_samples, diff_samples = samples
+    overlap_samples += overlap
+    diff_samples += differentiation
+    
+    # Clip to valid ranges, in place (differentiation >= 0.01 avoids
+    # division by zero)
+    np.clip(overlap_samples, 0, 1, out=overlap_samples)
+    np.clip(diff_samples, 0.01, 1, out=diff_samples)
     
     # Calculate i-factor for each sample
-    i_samples = overlap_samples / diff_samples
+    i_samples = overlap_samples
+    i_samples /= diff_samples
     
     # 95% confidence interval
-    ci_lower = float(np.percentile(i_samples, 2.5))
-    ci_upper = float(np.percentile(i_samples, 97.5))
+    ci_lower, ci_upper = _quantiles_inplace(i_samples, (0.025, 0.975))
     
-    return (ci_lower, ci_upper)
+    return (float(ci_lower), float(ci_upper))
+
+
+def _bootstrap_batch(
+    overlaps: np.ndarray,
+    differentiations: np.ndarray,
+    uncertainties: np.ndarray,
+    n_samples: int,
+    seeds: List[np.random.SeedSequence]
+) -> np.ndarray:
+    """
+    Bootstrap confidence intervals for many interactions, as an (N, 2) array.
+    
+    Each interaction draws from its own seed exactly as
+    _bootstrap_confidence_interval would, so its interval does not depend
+    on the other rows. Draws are written into (rows, 2, n_samples) blocks
+    of at most _BATCH_DRAW_LIMIT normals, and scaling, clipping, division
+    and quantiles are done on whole blocks.
+    """
+    ci = np.empty((len(seeds), 2))
+    step = max(1, _BATCH_DRAW_LIMIT // (2 * n_samples))
+    
+    for start in range(0, len(seeds), step):
+        block = slice(start, start + step)
+        samples = np.empty((len(seeds[block]), 2, n_samples))
+        for row, seed in zip(samples, seeds[block]):
+            np.random.default_rng(seed).standard_normal(out=row)
+        samples *= uncertainties[block, None, None]
+        overlap_samples = samples[:, 0]
+        diff_samples = samples[:, 1]
+        overlap_samples += overlaps[block, None]
+        diff_samples += differentiations[block, None]
+        np.clip(overlap_samples, 0, 1, out=overlap_samples)
+        np.clip(diff_samples, 0.01, 1, out=diff_samples)
+        
+        i_samples = overlap_samples
+        i_samples /= diff_samples
+        ci[block, 0], ci[block, 1] = _quantiles_inplace(i_samples, (0.025, 0.975))
+    
+    return ci
+
+
+@njit(cache=True)
+def _bootstrap_njit(overlap, differentiation, uncertainty, n, seed):
+    """
+    i-factor bootstrap samples, drawn, clipped and divided in a single loop
+    with no temporary arrays. Seeds Numba's own generator, not NumPy's.
+    """
+    np.random.seed(seed)
+    out = np.empty(n)
+    for k in range(n):
+        o = min(1.0, max(0.0, overlap + uncertainty * np.random.standard_normal()))
+        d = min(1.0, max(0.01, differentiation + uncertainty * np.random.standard_normal()))
+        out[k] = o / d
+    return out
+
+
+def _quantiles_inplace(
+    samples: np.ndarray,
+    q: Tuple[float, ...]
+) -> Tuple[float, ...]:
+    """
+    Quantiles along the last axis of a scratch array, matching
+    np.quantile's default method.
+    
+    Only the order statistics that the linear interpolation needs are
+    selected, with one in-place np.partition (O(n), no copy). The order
+    of samples is destroyed.
+    """
+    n = samples.shape[-1]
+    positions = [qi * (n - 1) for qi in q]
+    lows = [int(pos) for pos in positions]
+    highs = [min(low + 1, n - 1) for low in lows]
+    samples.partition(sorted(set(lows + highs)), axis=-1)
+    
+    return tuple(
+        samples[..., low] + (samples[..., high] - samples[..., low]) * (pos - low)
+        for pos, low, high in zip(positions, lows, highs)
+    )
 
 
 def _generate_interpretation(
@@ -357,8 +776,7 @@ def analyze_interaction(
     """
     Analyze interaction between two named entities.
     
-    Wrapper around calculate_i_factor that returns a structured result
-    with entity names included.
+    Wrapper around calculate_i_factor for a named pair of entities.
     
     Parameters:
         entity1_name: Name of first entity
@@ -368,24 +786,14 @@ def analyze_interaction(
     Returns:
         InteractionResult dataclass with all results
     """
-    result_dict = calculate_i_factor(**kwargs)
-    
-    result = InteractionResult(
-        i_factor=result_dict['i_factor'],
-        overlap=result_dict['overlap'],
-        differentiation=result_dict['differentiation'],
-        regime=result_dict['regime'],
-        confidence_interval=result_dict.get('confidence_interval'),
-        interpretation=result_dict['interpretation'],
-        method=result_dict['method']
-    )
-    
-    return result
+    return calculate_i_factor(**kwargs)
 
 
 def compare_multiple_interactions(
-    interactions: List[Dict]
-) -> List[InteractionResult]:
+    interactions: List[Dict],
+    random_state: RandomSeed = None,
+    n_jobs: int = 1
+) -> InteractionResultArray:
     """
     Compare multiple interactions to identify cooperation patterns in communities.
     
@@ -395,20 +803,149 @@ def compare_multiple_interactions(
                 {'entity1': 'Species A', 'entity2': 'Species B', 'overlap': 0.3, 'differentiation': 0.85},
                 {'entity1': 'Species A', 'entity2': 'Species C', 'overlap': 0.7, 'differentiation': 0.4},
             ]
+        random_state: Seed (an int, SeedSequence or Generator) for the
+            bootstrap of interactions that give an uncertainty but no
+            random_state of their own. The interaction at position k uses
+            child k of this seed (SeedSequence.spawn), and its interval is
+            the one calculate_i_factor gives with that child as random_state
+        n_jobs: Worker processes for the interactions calculated one at a
+            time, e.g. those with bootstrap uncertainty (1 runs them in this
+            process; -1 uses every CPU). Results do not depend on n_jobs.
+            Workers are fresh interpreters, so scripts using n_jobs must
+            guard their entry point with if __name__ == '__main__'.
     
     Returns:
-        List of InteractionResult objects, sorted by i-factor
-    """
-    results = []
+        InteractionResultArray sorted by i-factor; iterating it gives
+        InteractionResult objects, as earlier versions' list did
     
-    for interaction in interactions:
-        entity1 = interaction.pop('entity1', 'Entity1')
-        entity2 = interaction.pop('entity2', 'Entity2')
+    Interactions given only as (overlap, differentiation), optionally with
+    uncertainty and bootstrap_n, are calculated together in this process:
+    i-factors with calculate_i_factor_batch and confidence intervals in
+    blocks per bootstrap size. Any others are calculated one at a time.
+    """
+    n = len(interactions)
+    names = []
+    i_factor = np.empty(n)
+    overlap = np.empty(n)
+    differentiation = np.empty(n)
+    confidence_interval = np.full((n, 2), np.nan)
+    method = ['direct'] * n
+    direct_rows = []
+    bootstrap_rows = {}
+    bootstrap_seeds = {}
+    single_rows = []
+    single_kwargs = []
+    if isinstance(random_state, np.random.SeedSequence):
+        seed_sequence = random_state
+    elif isinstance(random_state, np.random.Generator):
+        # Entropy drawn from the generator, so it advances as when it is
+        # passed to calculate_i_factor
+        seed_sequence = np.random.SeedSequence(
+            random_state.integers(2**63, size=4).tolist()
+        )
+    else:
+        seed_sequence = np.random.SeedSequence(random_state)
+    # One child seed per interaction, by position in the list
+    children = seed_sequence.spawn(n)
+    
+    for row, interaction in enumerate(interactions):
+        # Names are read, not popped, so the caller's dicts are left intact
+        names.append((
+            interaction.get('entity1', 'Entity1'),
+            interaction.get('entity2', 'Entity2')
+        ))
+        interaction = {
+            key: value for key, value in interaction.items()
+            if key not in ('entity1', 'entity2')
+        }
         
-        result = analyze_interaction(entity1, entity2, **interaction)
-        results.append(result)
+        if (interaction.keys() <= _BATCH_KEYS
+                and interaction.get('overlap') is not None
+                and interaction.get('differentiation') is not None):
+            direct_rows.append(row)
+            uncertainty = interaction.get('uncertainty')
+            if uncertainty is not None and uncertainty > 0:
+                n_samples = interaction.get('bootstrap_n', 1000)
+                bootstrap_rows.setdefault(n_samples, []).append(row)
+                bootstrap_seeds.setdefault(n_samples, []).append(children[row])
+            continue
+        
+        if interaction.get('uncertainty'):
+            interaction = {'random_state': children[row], **interaction}
+        single_rows.append(row)
+        single_kwargs.append(interaction)
     
-    # Sort by i-factor (most cooperative first)
-    results.sort(key=lambda x: x.i_factor)
+    if n_jobs != -1 and not (isinstance(n_jobs, int) and n_jobs >= 1):
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs}")
+    
+    if n_jobs == 1 or len(single_kwargs) < 2:
+        outputs = map(_analyze_row, single_kwargs)
+    else:
+        with ProcessPoolExecutor(
+            None if n_jobs == -1 else n_jobs, mp_context=_pool_context()
+        ) as executor:
+            outputs = list(executor.map(_analyze_row, single_kwargs))
+    
+    for row, (row_i, row_overlap, row_diff, row_ci, row_method) in zip(
+        single_rows, outputs
+    ):
+        i_factor[row] = row_i
+        overlap[row] = row_overlap
+        differentiation[row] = row_diff
+        if row_ci is not None:
+            confidence_interval[row] = row_ci
+        method[row] = row_method
+    
+    if direct_rows:
+        batch = calculate_i_factor_batch(
+            [interactions[row]['overlap'] for row in direct_rows],
+            [interactions[row]['differentiation'] for row in direct_rows]
+        )
+        i_factor[direct_rows] = batch['i_factor']
+        overlap[direct_rows] = batch['overlap']
+        differentiation[direct_rows] = batch['differentiation']
+    
+    for n_samples, rows in bootstrap_rows.items():
+        confidence_interval[rows] = _bootstrap_batch(
+            overlap[rows], differentiation[rows],
+            np.array([interactions[row]['uncertainty'] for row in rows], dtype=float),
+            n_samples,
+            bootstrap_seeds[n_samples]
+        )
     
-    return results
+    # Sort by i-factor (most cooperative first)
+    order = np.argsort(i_factor, kind='stable')
+    i_factor = i_factor[order]
+    
+    return InteractionResultArray(
+        i_factor=i_factor,
+        overlap=overlap[order],
+        differentiation=differentiation[order],
+        regime_code=_regime_codes(i_factor),
+        names=[names[k] for k in order],
+        confidence_interval=confidence_interval[order],
+        method=[method[k] for k in order]
+    )
+
+
+def _pool_context():
+    """
+    Start method for worker processes. Forking after Numba's parallel
+    kernels have started their thread pool can deadlock, so fresh
+    interpreters are used instead (forkserver where available).
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _analyze_row(kwargs: Dict) -> Tuple:
+    """
+    Numeric fields of calculate_i_factor(**kwargs) as a plain tuple, cheap
+    to send back from a worker process.
+    """
+    result = calculate_i_factor(include_interpretation=False, **kwargs)
+    return (
+        result.i_factor, result.overlap, result.differentiation,
+        result.confidence_interval, result.method
+    )
@@ -6,11 +6,14 @@ Validates calculations against book examples and October 2025 validation results
 Run with: python test_calculator.py
 """
 
+import dataclasses
+import pickle
 import sys
 sys.path.insert(0, 'src')
 
 import melv
 import numpy as np
+from melv import PRED_TABLE, CONF_TABLE
 
 
 def test_cleaner_fish():
@@ -111,6 +114,22 @@ def test_uncertainty_quantification():
     assert 0.05 < ci_width < 0.30, f"CI width seems wrong: {ci_width}"
     assert ci_lower < result['i_factor'] < ci_upper, "i-factor not in CI"
     
+    large = melv.calculate_i_factor(
+        overlap=0.3, differentiation=0.85, uncertainty=0.05,
+        bootstrap_n=20000, random_state=42
+    )
+    large_lower, large_upper = large['confidence_interval']
+    assert abs(large_lower - ci_lower) < 0.02 and abs(large_upper - ci_upper) < 0.02, \
+        "Large bootstrap disagrees with small one"
+    
+    low_memory = melv.calculate_i_factor(
+        overlap=0.3, differentiation=0.85, uncertainty=0.05,
+        bootstrap_n=20000, random_state=42, low_memory_bootstrap=True
+    )
+    low_lower, low_upper = low_memory['confidence_interval']
+    assert abs(low_lower - large_lower) < 0.01 and abs(low_upper - large_upper) < 0.01, \
+        "Low-memory bootstrap disagrees with default one"
+    
     print("✓ PASSED")
     return True
 
@@ -136,6 +155,14 @@ def test_beta_calculation():
     assert 0.70 < result['cooperation_potential'] < 0.76, \
         f"Expected ~0.73, got {result['cooperation_potential']}"
     
+    for weights in [(0.335, 0.335, 0.34), (0.34, 0.33, 0.34)]:
+        melv.calculate_beta(0.85, 0.90, 0.75, weights=weights)  # within tolerance
+    try:
+        melv.calculate_beta(0.85, 0.90, 0.75, weights=(float('nan'), 0.5, 0.5))
+        assert False, "Expected ValueError for NaN weights"
+    except ValueError:
+        pass
+    
     print("✓ PASSED")
     return True
 
@@ -165,6 +192,627 @@ def test_combined_analysis():
     return True
 
 
+def test_beta_batch():
+    """Test vectorized β-factor over a batch of cases."""
+    print("\n" + "="*60)
+    print("TEST 7: Beta-factor Batch Calculation")
+    print("="*60)
+    
+    physical = np.array([0.85, 0.40, 0.60])
+    service = np.array([0.90, 0.50, 0.60])
+    temporal = np.array([0.75, 0.60, 0.60])
+    perpetuity = np.array([0.88, 0.50, 1.00])
+    
+    result = melv.calculate_beta(physical, service, temporal, perpetuity)
+    
+    print(f"β: {np.round(result['beta'], 2)}")
+    print(f"Expected: matches scalar calculation for every case")
+    
+    for k in range(len(physical)):
+        scalar = melv.calculate_beta(
+            float(physical[k]), float(service[k]),
+            float(temporal[k]), float(perpetuity[k])
+        )
+        assert result['beta'][k] == scalar['beta'], \
+            f"Case {k}: batch {result['beta'][k]} != scalar {scalar['beta']}"
+        assert np.isclose(result['cooperation_potential'][k],
+                          scalar['cooperation_potential']), \
+            f"Case {k}: cooperation potential mismatch"
+    
+    mixed = melv.calculate_beta(0.85, service, 0.75)
+    assert np.allclose(mixed['beta'], melv.calculate_beta(
+        np.full(3, 0.85), service, np.full(3, 0.75)
+    )['beta']), "Scalar and array arguments not broadcast"
+    
+    try:
+        melv.calculate_beta(physical, service, np.array([0.5, 1.5, 0.5]))
+        assert False, "Expected ValueError for out-of-range input"
+    except ValueError:
+        pass
+    
+    print("✓ PASSED")
+    return True
+
+
+def test_combined_batch():
+    """Test vectorized combined analysis agrees with the scalar version."""
+    print("\n" + "="*60)
+    print("TEST 8: Combined Analysis Batch")
+    print("="*60)
+    
+    i_grid, beta_grid = np.meshgrid(
+        np.linspace(0.2, 1.6, 15), np.linspace(0.3, 0.95, 14)
+    )
+    perpetuity = 0.8
+    
+    result = melv.combined_analysis(i_grid, beta_grid, perpetuity=perpetuity)
+    
+    print(f"Cases evaluated: {i_grid.size}")
+    print(f"Expected: same prediction and confidence as scalar calls")
+    
+    for idx in np.ndindex(i_grid.shape):
+        scalar = melv.combined_analysis(
+            float(i_grid[idx]), float(beta_grid[idx]), perpetuity=perpetuity
+        )
+        assert result['prediction'][idx] == scalar['prediction'], \
+            f"Case {idx}: {result['prediction'][idx]} != {scalar['prediction']}"
+        assert result['confidence'][idx] == scalar['confidence'], \
+            f"Case {idx}: {result['confidence'][idx]} != {scalar['confidence']}"
+    
+    perpetuities = np.array([0.88, 0.2])
+    by_perpetuity = melv.combined_analysis(0.35, 0.83, perpetuity=perpetuities)
+    broadcast = melv.combined_analysis(np.array([0.35]), 0.83, perpetuity=perpetuities)
+    assert by_perpetuity.prediction.shape == broadcast.prediction.shape == (2,)
+    for k, phi in enumerate(perpetuities):
+        scalar = melv.combined_analysis(0.35, 0.83, perpetuity=float(phi))
+        assert by_perpetuity.confidence[k] == broadcast.confidence[k] == scalar.confidence
+    
+    print("✓ PASSED")
+    return True
+
+
+def test_beta_batch_soa():
+    """Test calculate_beta_batch on structure-of-arrays input."""
+    print("\n" + "="*60)
+    print("TEST 9: Beta-factor Batch (SoA)")
+    print("="*60)
+    
+    rng = np.random.default_rng(0)
+    physical, service, temporal, perpetuity = rng.uniform(0, 1, size=(4, 10000))
+    
+    batch = melv.calculate_beta_batch(physical, service, temporal, perpetuity)
+    reference = melv.calculate_beta(physical, service, temporal, perpetuity)
+    
+    max_error = np.max(np.abs(batch['beta'] - reference['beta']))
+    print(f"Samples: {len(physical)}")
+    print(f"Max |β_batch - β|: {max_error:.2e}")
+    print(f"Expected: agreement well below the 0.01 display precision")
+    
+    assert max_error < 1e-12, f"Batch β deviates by {max_error}"
+    assert np.allclose(batch['cooperation_potential'],
+                       reference['cooperation_potential'], rtol=0, atol=1e-12)
+    assert batch['beta'].dtype == np.float64, "Default batch dtype should be float64"
+    
+    batch32 = melv.calculate_beta_batch(
+        *(x.astype(np.float32) for x in (physical, service, temporal, perpetuity)),
+        dtype=np.float32
+    )
+    assert batch32['beta'].dtype == np.float32
+    assert np.allclose(batch32['beta'], reference['beta'], rtol=0, atol=1e-5)
+    assert np.allclose(batch32['cooperation_potential'],
+                       reference['cooperation_potential'], rtol=0, atol=1e-5)
+    
+    print("✓ PASSED")
+    return True
+
+
+def test_result_objects():
+    """Test attribute and dict-style access on β, combined and i-factor results."""
+    print("\n" + "="*60)
+    print("TEST 10: Result Objects")
+    print("="*60)
+    
+    beta_result = melv.calculate_beta(0.85, 0.90, 0.75, perpetuity=0.88)
+    combined = melv.combined_analysis(0.35, beta_result.beta, perpetuity=0.88)
+    
+    print(f"Types: {type(beta_result).__name__}, {type(combined).__name__}")
+    print(f"Expected: attribute and key access agree, interpretation on demand")
+    
+    assert beta_result.beta == beta_result['beta']
+    assert combined.prediction == combined['prediction']
+    assert beta_result['interpretation'].startswith("β (compatibility) = 0.83")
+    assert combined.interpretation.startswith("=== COMBINED MELV ANALYSIS ===")
+    
+    try:
+        beta_result['no_such_key']
+        assert False, "Expected KeyError for unknown key"
+    except KeyError:
+        pass
+    
+    assert 'beta' in beta_result and 'interpretation' in combined
+    assert 0 not in beta_result and '_interpretation' not in combined
+    
+    supplied = melv.CompatibilityResult(0.5, 0.5, 0.5, 0.5, None, None, "given")
+    assert supplied.interpretation == "given"
+    
+    changed = dataclasses.replace(beta_result, beta=0.5)
+    assert changed.beta == 0.5 and changed.interpretation.startswith("β (compatibility) = 0.50")
+    assert '_interpretation' not in dataclasses.asdict(combined)
+    swept = melv.calculate_beta(np.array([0.85, 0.40]), 0.90, 0.75)
+    assert dataclasses.replace(swept, perpetuity=None).interpretation.shape == (2,)
+    restored = pickle.loads(pickle.dumps(combined))
+    assert restored == combined and restored.interpretation == combined.interpretation
+    
+    as_dict = combined.to_dict()
+    assert as_dict['prediction'] == combined.prediction
+    assert as_dict['interpretation'] == combined.interpretation
+    
+    i_result = melv.calculate_i_factor(overlap=0.3, differentiation=0.85)
+    assert i_result.i_factor == i_result['i_factor']
+    assert i_result.to_dict()['interpretation'] == i_result.interpretation
+    assert i_result.interpretation.startswith("i-factor = 0.35")
+    quiet = melv.calculate_i_factor(
+        overlap=0.3, differentiation=0.85, include_interpretation=False
+    )
+    assert quiet.interpretation is None and quiet.regime == i_result.regime
+    
+    legacy = melv.InteractionResult(0.35, 0.3, 0.85, 'Cooperative', None, "given")
+    assert legacy.interpretation == "given" and legacy.method == "direct"
+    assert dataclasses.replace(i_result, method="resource").interpretation.startswith(
+        "i-factor = 0.35 (calculated from resource)"
+    )
+    assert '_interpretation' not in dataclasses.asdict(i_result)
+    
+    print("✓ PASSED")
+    return True
+
+
+def test_fused_sweep():
+    """Test the fused β + prediction kernel against the per-pair functions."""
+    print("\n" + "="*60)
+    print("TEST 11: Fused Agent-Pair Sweep")
+    print("="*60)
+    
+    rng = np.random.default_rng(1)
+    physical, service, temporal, perpetuity = rng.uniform(0, 1, size=(4, 500))
+    i_factor = rng.uniform(0.1, 2.0, size=500)
+    
+    sweep = melv.calculate_beta_and_combined(
+        physical, service, temporal, perpetuity, i_factor
+    )
+    
+    print(f"Pairs evaluated: {len(i_factor)}")
+    print(f"Expected: identical to calculate_beta + combined_analysis")
+    
+    for k in range(len(i_factor)):
+        beta = melv.calculate_beta(
+            physical[k], service[k], temporal[k], perpetuity[k]
+        )
+        combined = melv.combined_analysis(
+            i_factor[k], beta['beta'], perpetuity=perpetuity[k]
+        )
+        assert np.isclose(sweep['beta'][k], beta['beta'])
+        assert np.isclose(sweep['cooperation_potential'][k],
+                          beta['cooperation_potential'])
+        assert PRED_TABLE[sweep['prediction_code'][k]] == combined['prediction'], \
+            f"Pair {k}: prediction mismatch"
+        assert CONF_TABLE[sweep['confidence_code'][k]] == combined['confidence'], \
+            f"Pair {k}: confidence mismatch"
+    
+    print("✓ PASSED")
+    return True
+
+
+def test_interaction_batch():
+    """Test batch i-factors and compare_multiple_interactions against the scalar path."""
+    print("\n" + "="*60)
+    print("TEST 12: Batch Interaction Comparison")
+    print("="*60)
+    
+    rng = np.random.default_rng(2)
+    overlaps = rng.uniform(0, 1, size=200)
+    diffs = rng.uniform(0.05, 1, size=200)
+    
+    batch = melv.calculate_i_factor_batch(overlaps, diffs)
+    
+    print(f"Pairs evaluated: {len(overlaps)}")
+    print(f"Expected: identical to calculate_i_factor")
+    
+    for k in range(len(overlaps)):
+        single = melv.calculate_i_factor(overlap=overlaps[k], differentiation=diffs[k])
+        assert batch['i_factor'][k] == single['i_factor']
+        assert batch['regime'][k] == single['regime'], f"Pair {k}: regime mismatch"
+    
+    interactions = [
+        {'entity1': 'A', 'entity2': 'B', 'overlap': 0.7, 'differentiation': 0.4},
+        {'entity1': 'A', 'entity2': 'C', 'overlap': 0.3, 'differentiation': 0.85},
+        {'entity1': 'B', 'entity2': 'C', 'overlap': 0.5, 'differentiation': 0.5,
+         'uncertainty': 0.05, 'random_state': 0},
+    ]
+    results = melv.compare_multiple_interactions(interactions)
+    assert melv.compare_multiple_interactions(interactions).names == results.names, \
+        "Input dicts were modified"
+    i_factors = [r.i_factor for r in results]
+    
+    print(f"Sorted i-factors: {[round(i, 2) for i in i_factors]}")
+    
+    assert i_factors == sorted(i_factors), "Results not sorted by i-factor"
+    assert isinstance(results, melv.InteractionResultArray)
+    assert results.names[0] == ('A', 'C') and results.regime[-1] == 'Competitive'
+    assert np.isnan(results.confidence_interval[0]).all()
+    assert [r.i_factor for r in results[:2]] == i_factors[:2]
+    assert results[-1].i_factor == i_factors[-1] and len(results[::2]) == 2
+    
+    uncertain = [
+        {'overlap': 0.5, 'differentiation': 0.5, 'uncertainty': 0.05},
+        {'overlap': 0.2, 'differentiation': 0.6, 'uncertainty': 0.05},
+    ]
+    first = melv.compare_multiple_interactions(uncertain, random_state=7)
+    again = melv.compare_multiple_interactions(uncertain, random_state=7)
+    assert np.array_equal(first.confidence_interval, again.confidence_interval), \
+        "Seeded comparison not reproducible"
+    spawned = melv.compare_multiple_interactions(
+        uncertain, random_state=np.random.SeedSequence(7)
+    )
+    assert np.array_equal(spawned.confidence_interval, first.confidence_interval), \
+        "SeedSequence seed differs from the equivalent int seed"
+    generator = np.random.default_rng(7)
+    drawn = melv.compare_multiple_interactions(uncertain, random_state=generator)
+    assert not np.array_equal(
+        melv.compare_multiple_interactions(uncertain, random_state=generator).confidence_interval,
+        drawn.confidence_interval
+    ), "Generator seed not advanced between calls"
+    assert np.array_equal(
+        melv.compare_multiple_interactions(
+            uncertain, random_state=np.random.default_rng(7)
+        ).confidence_interval,
+        drawn.confidence_interval
+    ), "Generator seed not reproducible"
+    single = melv.calculate_i_factor(
+        overlap=0.2, differentiation=0.6, uncertainty=0.05,
+        random_state=np.random.SeedSequence(7).spawn(2)[1]
+    )
+    assert np.array_equal(first.confidence_interval[0], single['confidence_interval']), \
+        "Batched bootstrap differs from calculate_i_factor with the row's child seed"
+    mixed = melv.compare_multiple_interactions(
+        [uncertain[0],
+         {'temporal_patterns': (rng.random(20), rng.random(20)), 'uncertainty': 0.05},
+         uncertain[1]],
+        random_state=7
+    )
+    assert np.array_equal(mixed.confidence_interval[mixed.overlap == 0.5],
+                          first.confidence_interval[first.overlap == 0.5]), \
+        "Row's interval depends on the kind of the rows after it"
+    
+    patterns = [
+        {'temporal_patterns': (rng.random(50), rng.random(50)), 'uncertainty': 0.05}
+        for _ in range(3)
+    ]
+    serial = melv.compare_multiple_interactions(patterns, random_state=7)
+    pooled = melv.compare_multiple_interactions(patterns, random_state=7, n_jobs=2)
+    assert np.allclose(serial.confidence_interval, pooled.confidence_interval, rtol=1e-12), \
+        "Parallel comparison differs from serial"
+    try:
+        melv.compare_multiple_interactions(uncertain, n_jobs=0)
+        assert False, "Expected ValueError for n_jobs=0"
+    except ValueError:
+        pass
+    assert results[1].confidence_interval is not None
+    assert results[0].interpretation == melv.calculate_i_factor(
+        overlap=0.3, differentiation=0.85
+    )['interpretation']
+    
+    print("✓ PASSED")
+    return True
+
+
+def test_pattern_inputs():
+    """Test i-factors from resource, temporal and spatial patterns."""
+    print("\n" + "="*60)
+    print("TEST 13: Pattern Inputs")
+    print("="*60)
+    
+    rng = np.random.default_rng(3)
+    t = np.linspace(0, 1, 200)
+    pattern_inputs = {
+        'resource_vectors': (rng.random(500), rng.random(500)),
+        # Distinct smooth peaks: near-ties may resolve differently in float32
+        'temporal_patterns': (np.exp(-((t - 0.3) / 0.05)**2),
+                              np.exp(-((t - 0.6) / 0.1)**2)),
+        'spatial_patterns': (rng.random((20, 20)), rng.random((20, 20))),
+    }
+    
+    print(f"Methods: {', '.join(pattern_inputs)}")
+    print(f"Expected: reference formulas reproduced, float32 agrees with float64,")
+    print(f"          invalid patterns rejected")
+    
+    for method, patterns in pattern_inputs.items():
+        exact = melv.calculate_i_factor(**{method: patterns})
+        single = melv.calculate_i_factor(**{method: patterns}, dtype=np.float32)
+        assert np.isclose(single.i_factor, exact.i_factor, rtol=1e-5), \
+            f"{method}: float32 disagrees with float64"
+        assert single.regime == exact.regime
+    
+    # Fixed inputs against the defining formulas
+    r1 = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0])
+    r2 = np.array([2.0, 7.0, 1.0, 8.0, 2.0, 8.0, 1.0, 8.0])
+    result = melv.calculate_i_factor(resource_vectors=(r1, r2))
+    assert np.isclose(result.overlap, r1 @ r2 / (np.linalg.norm(r1) * np.linalg.norm(r2)),
+                      rtol=1e-9)
+    assert np.isclose(result.differentiation, 1 - abs(np.corrcoef(r1, r2)[0, 1]), rtol=1e-9)
+    
+    t1 = np.array([0, 1, 2, 4, 7, 9, 7, 4, 2, 1, 0, 0,
+                   0, 0, 1, 1, 2, 2, 3, 3, 2, 1, 0, 0], dtype=float)
+    t2 = np.roll(t1, 9) * 2 + 1
+    result = melv.calculate_i_factor(temporal_patterns=(t1, t2))
+    assert np.isclose(result.overlap, abs(np.corrcoef(t1, t2)[0, 1]), rtol=1e-9)
+    assert result.differentiation == abs(np.argmax(t1) - np.argmax(t2)) / len(t1)
+    
+    s1 = np.array([[5, 4, 3, 1], [4, 3, 1, 0], [2, 1, 0, 0]], dtype=float)
+    s2 = s1[::-1, ::-1] + 0.5
+    p1, p2 = s1.ravel() / s1.sum(), s2.ravel() / s2.sum()
+    cells = np.arange(s1.size)
+    result = melv.calculate_i_factor(spatial_patterns=(s1, s2))
+    assert np.isclose(result.overlap, np.minimum(p1, p2).sum(), rtol=1e-9)
+    assert np.isclose(result.differentiation, abs(cells @ p1 - cells @ p2) / s1.size, rtol=1e-9)
+    
+    for bad in [(np.array([]), np.array([])),
+                (np.array([1.0, 2.0, np.nan, 3.0]), np.arange(4.0)),
+                (np.ones((3, 4)), np.ones((3, 4)))]:
+        try:
+            melv.calculate_i_factor(temporal_patterns=bad)
+            assert False, "Expected ValueError for empty, non-finite or 2-D pattern"
+        except ValueError:
+            pass
+    try:
+        melv.calculate_i_factor(resource_vectors=(np.ones((3, 4)), np.ones((3, 4))))
+        assert False, "Expected ValueError for 2-D resource vectors"
+    except ValueError:
+        pass
+    for bad in [(np.array([[1, -0.9], [0.5, -0.5]]), np.ones((2, 2))),
+                (np.ones((2, 2)), np.array([[1.0, np.nan], [0.5, 0.5]])),
+                (np.empty((0, 3)), np.empty((0, 3)))]:
+        try:
+            melv.calculate_i_factor(spatial_patterns=bad)
+            assert False, "Expected ValueError for invalid spatial pattern"
+        except ValueError:
+            pass
+    
+    print("✓ PASSED")
+    return True
+
+
+def test_interpretation_text():
+    """Test interpretation text exactly, for each layout and category boundary."""
+    print("\n" + "="*60)
+    print("TEST 14: Interpretation Text")
+    print("="*60)
+    
+    beta_cases = [
+        ((0.85, 0.9, 0.75, 0.88), (
+            "β (compatibility) = 0.83\n"
+            "\n"
+            "EXCELLENT compatibility: \n"
+            "\n"
+            "Dimension analysis:\n"
+            "• Physical: 0.85 - Strong physical compatibility\n"
+            "• Service: 0.90 - Excellent service-need matching\n"
+            "• Temporal: 0.75 - Adequate timing coordination\n"
+            "\n"
+            "Perpetuit factor (φ) = 0.88 - Highly sustainable relationship\n"
+            "\n"
+            "Cooperation potential (φ × β) = 0.73\n"
+            "Strong potential for lasting cooperation"
+        )),
+        ((0.6, 0.8, 0.6, None), (
+            "β (compatibility) = 0.67\n"
+            "\n"
+            "GOOD compatibility: \n"
+            "\n"
+            "Dimension analysis:\n"
+            "• Physical: 0.60 - Physical constraints present\n"
+            "• Service: 0.80 - Services align reasonably well\n"
+            "• Temporal: 0.60 - Temporal coordination challenges\n"
+        )),
+        ((0.6, 0.6, 0.6, 0.6), (
+            "β (compatibility) = 0.60\n"
+            "\n"
+            "GOOD compatibility: \n"
+            "\n"
+            "Dimension analysis:\n"
+            "• Physical: 0.60 - Physical constraints present\n"
+            "• Service: 0.60 - Service-need mismatch detected\n"
+            "• Temporal: 0.60 - Temporal coordination challenges\n"
+            "\n"
+            "Perpetuit factor (φ) = 0.60 - Sustainability concerns\n"
+            "\n"
+            "Cooperation potential (φ × β) = 0.36\n"
+            "Limited cooperation potential"
+        )),
+        ((0.4, 0.4, 0.4, 0.8), (
+            "β (compatibility) = 0.40\n"
+            "\n"
+            "LIMITED compatibility: \n"
+            "\n"
+            "Dimension analysis:\n"
+            "• Physical: 0.40 - Physical constraints present\n"
+            "• Service: 0.40 - Service-need mismatch detected\n"
+            "• Temporal: 0.40 - Temporal coordination challenges\n"
+            "\n"
+            "Perpetuit factor (φ) = 0.80 - Reasonably sustainable\n"
+            "\n"
+            "Cooperation potential (φ × β) = 0.32\n"
+            "Limited cooperation potential"
+        )),
+    ]
+    combined_cases = [
+        ((0.35, 0.83, 0.88, None, None), (
+            "=== COMBINED MELV ANALYSIS ===\n"
+            "\n"
+            "i-factor = 0.35 → Cooperative regime\n"
+            "  ✓ Interaction costs below critical threshold\n"
+            "  ✓ Cooperation is energetically favorable\n"
+            "\n"
+            "β (compatibility) = 0.83\n"
+            "  ✓ High compatibility for cooperation\n"
+            "\n"
+            "φ (perpetuity) = 0.88\n"
+            "Cooperation potential (φ × β) = 0.73\n"
+            "\n"
+            "=== PREDICTION ===\n"
+            "Stable cooperation\n"
+            "Confidence: High\n"
+            "\n"
+            "Both conditions favor cooperation: low interaction costs (i < "
+            "1) and good compatibility (β > 0.6). Expect cooperative "
+            "dynamics.\n"
+        )),
+        ((1.0, 0.65, None, 0.5, 0.5), (
+            "=== COMBINED MELV ANALYSIS ===\n"
+            "\n"
+            "i-factor = 1.00 → Critical regime\n"
+            "  (overlap: 0.50, differentiation: 0.50)\n"
+            "  ✗ Interaction costs exceed benefits\n"
+            "  ✗ Competition is energetically favorable\n"
+            "\n"
+            "β (compatibility) = 0.65\n"
+            "  ~ Moderate compatibility\n"
+            "\n"
+            "=== PREDICTION ===\n"
+            "Unstable regime (near critical point)\n"
+            "Confidence: Low\n"
+            "\n"
+            "System near critical threshold. Outcomes highly sensitive to "
+            "small parameter changes. Monitor closely for regime shifts.\n"
+        )),
+        ((1.05, 0.5, 0.6, None, None), (
+            "=== COMBINED MELV ANALYSIS ===\n"
+            "\n"
+            "i-factor = 1.05 → Competitive regime\n"
+            "  ✗ Interaction costs exceed benefits\n"
+            "  ✗ Competition is energetically favorable\n"
+            "\n"
+            "β (compatibility) = 0.50\n"
+            "  ✗ Limited compatibility\n"
+            "\n"
+            "φ (perpetuity) = 0.60\n"
+            "Cooperation potential (φ × β) = 0.30\n"
+            "\n"
+            "=== PREDICTION ===\n"
+            "Unstable regime (near critical point)\n"
+            "Confidence: Low\n"
+            "\n"
+            "High interaction costs (i > 1) create competitive pressure. "
+            "Even with good compatibility, cooperation is unlikely to "
+            "emerge.\n"
+        )),
+        ((0.5, 0.6, 0.5, None, None), (
+            "=== COMBINED MELV ANALYSIS ===\n"
+            "\n"
+            "i-factor = 0.50 → Cooperative regime\n"
+            "  ✓ Interaction costs below critical threshold\n"
+            "  ✓ Cooperation is energetically favorable\n"
+            "\n"
+            "β (compatibility) = 0.60\n"
+            "  ~ Moderate compatibility\n"
+            "\n"
+            "φ (perpetuity) = 0.50\n"
+            "Cooperation potential (φ × β) = 0.30\n"
+            "\n"
+            "=== PREDICTION ===\n"
+            "Cooperation possible\n"
+            "Confidence: Low to Moderate\n"
+            "\n"
+            "System near critical threshold. Outcomes highly sensitive to "
+            "small parameter changes. Monitor closely for regime shifts.\n"
+        )),
+    ]
+    i_factor_cases = [
+        ((0.3, 0.85), (
+            "i-factor = 0.35 (calculated from direct)\n"
+            "\n"
+            "STRONG COOPERATION regime: Very low energetic cost of "
+            "interaction. High service differentiation (0.85) combined "
+            "with low resource overlap (0.30) creates strong synergy. "
+            "Entities gain more from cooperation than from independence."
+        )),
+        ((0.25, 0.5), (
+            "i-factor = 0.50 (calculated from direct)\n"
+            "\n"
+            "COOPERATIVE regime: Interaction costs are below the critical "
+            "threshold. Service differentiation (0.50) exceeds resource "
+            "overlap (0.25), making cooperation energetically favorable. "
+            "Mutual benefit exceeds interaction costs."
+        )),
+        ((0.5, 0.5), (
+            "i-factor = 1.00 (calculated from direct)\n"
+            "\n"
+            "CRITICAL THRESHOLD: The system is near the "
+            "cooperation-competition boundary. Resource overlap (0.50) "
+            "approximately equals service differentiation (0.50). Small "
+            "changes could shift the regime. This is a bifurcation point "
+            "where outcomes become highly sensitive."
+        )),
+        ((0.525, 0.5), (
+            "i-factor = 1.05 (calculated from direct)\n"
+            "\n"
+            "COMPETITIVE regime: Interaction costs exceed benefits. "
+            "Resource overlap (0.53) exceeds service differentiation "
+            "(0.50), making competition more favorable than cooperation. "
+            "Entities compete for limited resources."
+        )),
+        ((0.75, 0.5), (
+            "i-factor = 1.50 (calculated from direct)\n"
+            "\n"
+            "STRONG COMPETITION regime: Very high energetic cost of "
+            "interaction. High resource overlap (0.75) with low service "
+            "differentiation (0.50) creates strong competitive pressure. "
+            "Zero-sum dynamics dominate."
+        )),
+    ]
+
+    
+    print(f"Cases: {len(beta_cases) + len(combined_cases) + len(i_factor_cases)}")
+    print(f"Expected: text identical to the reference, for scalars and arrays")
+    
+    for (physical, service, temporal, perpetuity), expected in beta_cases:
+        result = melv.calculate_beta(physical, service, temporal, perpetuity=perpetuity)
+        assert result.interpretation == expected, \
+            f"β interpretation changed for {(physical, service, temporal, perpetuity)}"
+    
+    for (i_factor, beta, perpetuity, overlap, differentiation), expected in combined_cases:
+        result = melv.combined_analysis(
+            i_factor, beta, perpetuity=perpetuity,
+            overlap=overlap, differentiation=differentiation
+        )
+        assert result.interpretation == expected, \
+            f"Combined interpretation changed for i = {i_factor}, β = {beta}"
+    
+    for (overlap, differentiation), expected in i_factor_cases:
+        result = melv.calculate_i_factor(overlap=overlap, differentiation=differentiation)
+        assert result.interpretation == expected, \
+            f"i-factor interpretation changed for {(overlap, differentiation)}"
+    
+    # Array results give the same text per case
+    swept = melv.calculate_beta(
+        np.array([0.85, 0.6]), np.array([0.9, 0.6]), np.array([0.75, 0.6]),
+        perpetuity=np.array([0.88, 0.6])
+    )
+    assert list(swept.interpretation) == [beta_cases[0][1], beta_cases[2][1]]
+    combined = melv.combined_analysis(
+        np.array([0.35, 1.05]), np.array([0.83, 0.5]), perpetuity=np.array([0.88, 0.6])
+    )
+    assert list(combined.interpretation) == [combined_cases[0][1], combined_cases[2][1]]
+    compared = melv.compare_multiple_interactions([
+        {'overlap': overlap, 'differentiation': differentiation}
+        for (overlap, differentiation), _ in i_factor_cases
+    ])
+    assert [r.interpretation for r in compared] == [text for _, text in i_factor_cases]
+    
+    print("✓ PASSED")
+    return True
+
+
 def run_all_tests():
     """Run complete test suite."""
     print("\n" + "="*70)
@@ -178,7 +826,15 @@ def run_all_tests():
         test_critical_threshold,
         test_uncertainty_quantification,
         test_beta_calculation,
-        test_combined_analysis
+        test_combined_analysis,
+        test_beta_batch,
+        test_combined_batch,
+        test_beta_batch_soa,
+        test_result_objects,
+        test_fused_sweep,
+        test_interaction_batch,
+        test_pattern_inputs,
+        test_interpretation_text
     ]
     
     results = []